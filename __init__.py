@@ -12,6 +12,7 @@ bl_info = {
 
 import bpy
 from . import core
+from . import properties
 from . import operators
 from . import ui
 from . import data
@@ -19,6 +20,7 @@ from . import api
 
 modules = [
     core,
+    properties,
     operators,
     ui,
     data,
@@ -1,3 +1,14 @@
+# API version and configuration
+API_VERSION = "v1"
+DEFAULT_API_URL = "https://api.blendtagger.com"
+DEFAULT_TIMEOUT = 30  # seconds
+DEFAULT_MAX_RETRIES = 4  # retries for transient failures
+POOL_CONNECTIONS = 32  # pooled hosts per session
+POOL_MAXSIZE = 64  # pooled connections per host
+ASYNC_LIMIT_PER_HOST = 64  # pooled connections per host for async requests
+BATCH_CONCURRENCY = 16  # max in-flight submissions per batch
+
+# Submodules read the configuration above when imported
 from . import client
 from . import endpoints
 
@@ -13,8 +24,3 @@ def register():
 def unregister():
     for module in reversed(modules):
         module.unregister()
-
-# API version and configuration
-API_VERSION = "v1"
-DEFAULT_API_URL = "https://api.blendtagger.com"
-DEFAULT_TIMEOUT = 30  # seconds
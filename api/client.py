@@ -1,14 +1,96 @@
+import asyncio
+import functools
 import requests
 import json
 import logging
+import random
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from . import endpoints
-from . import API_VERSION, DEFAULT_API_URL, DEFAULT_TIMEOUT
+from .endpoints import DATACLASS_SLOTS
+from . import (API_VERSION, DEFAULT_API_URL, DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES,
+               POOL_CONNECTIONS, POOL_MAXSIZE, ASYNC_LIMIT_PER_HOST, BATCH_CONCURRENCY)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_monotonic = time.monotonic
+
+# Shared aiohttp session, created lazily so connections are kept alive
+# across async requests
+_async_session = None
+
+def _get_async_session() -> 'aiohttp.ClientSession':
+    """Get the shared aiohttp session, creating it if needed"""
+    global _async_session
+    if _async_session is None or _async_session.closed:
+        _async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=ASYNC_LIMIT_PER_HOST)
+        )
+    return _async_session
+
+async def _close_async_session() -> None:
+    """Close the shared aiohttp session"""
+    global _async_session
+    if _async_session is not None:
+        await _async_session.close()
+        _async_session = None
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars for the stdlib JSON encoder"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(data: Any) -> bytes:
+    """Serialize request body to JSON bytes"""
+    if orjson is not None:
+        # Index arrays may be passed as NumPy arrays without list conversion
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_json_default).encode('utf-8')
+
+def _loads(content: bytes) -> Any:
+    """Parse JSON response body"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Retry policy for transient failures
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_BACKOFF_BASE = 0.5  # seconds
+RETRY_BACKOFF_CAP = 30.0  # seconds
+
+def _should_retry(method: str, status_code: int) -> bool:
+    """Check if a response status is worth retrying"""
+    # 429 is rejected before processing, so any method can be replayed safely
+    return status_code == 429 or (status_code in RETRY_STATUS_CODES and
+                                  method in IDEMPOTENT_METHODS)
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Get delay before a retry, honoring the server's Retry-After"""
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass  # HTTP-date values fall back to exponential backoff
+    return (min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt) +
+            random.uniform(0, RETRY_BACKOFF_BASE))
+
+@dataclass(**DATACLASS_SLOTS)
 class APIResponse:
     """API Response container"""
     success: bool
@@ -19,46 +101,90 @@ class APIResponse:
 class BlendTaggerAPI:
     """BlendTagger API Client"""
 
-    def __init__(self, api_key: str, base_url: str = DEFAULT_API_URL):
+    def __init__(self,
+                 api_key: str,
+                 base_url: str = DEFAULT_API_URL,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
         self.session = requests.Session()
+
+        # Size the pool for concurrent batch submissions, the default of 10
+        # would make extra threads wait for a free connection
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Full URL (or URL template for parameterized paths) per endpoint name
+        self._url_cache: Dict[str, str] = {
+            name: f"{self.base_url}{endpoint.get_full_path(API_VERSION)}"
+            for name, endpoint in endpoints.ENDPOINTS.items()
+        }
         self.session.headers.update({
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
             'Accept': 'application/json',
             'User-Agent': f'BlendTagger-Client/{API_VERSION}'
         })
+        self.rate_limiter = RateLimiter()
+        self.cache = APICache()
+        self._batch_supported = True  # Cleared if the server lacks the batch endpoint
 
     def _make_request(self,
-                     method: str,
-                     endpoint: str,
-                     data: Optional[Dict] = None,
-                     params: Optional[Dict] = None) -> APIResponse:
-        """Make HTTP request to API"""
-        url = f"{self.base_url}/{API_VERSION}/{endpoint.lstrip('/')}"
+                      endpoint_name: str,
+                      data: Optional[Dict] = None,
+                      params: Optional[Dict] = None,
+                      **path_params: str) -> APIResponse:
+        """Make HTTP request to a named API endpoint"""
+        endpoint = endpoints.ENDPOINTS[endpoint_name]
+        method = endpoint.method
+        url = self._url_cache[endpoint_name]
+        if path_params:
+            url = url.format(**path_params)
+
+        # Only successful GETs are cached
+        cache_key = None
+        headers = None
+        if method == 'GET':
+            cache_key = f"{url}?{sorted(params.items())}" if params else url
+            cached = self.cache.get(cache_key, endpoint.cache_ttl)
+            if cached is not None:
+                return APIResponse(success=True, data=cached, status_code=200)
+            headers = self.cache.get_conditional_headers(cache_key)
 
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data if data else None,
-                params=params if params else None,
-                timeout=DEFAULT_TIMEOUT
-            )
+            response = self._send(method, url, endpoint_name, data, params, headers)
+
+            if response.status_code == 304 and cache_key:
+                return APIResponse(
+                    success=True,
+                    data=self.cache.revalidate(cache_key),
+                    status_code=response.status_code
+                )
 
             response.raise_for_status()
+            response_data = _loads(response.content) if response.content else None
+            if cache_key:
+                self.cache.set(cache_key, response_data,
+                               response.headers.get('ETag'),
+                               response.headers.get('Last-Modified'))
+
             return APIResponse(
                 success=True,
-                data=response.json() if response.content else None,
+                data=response_data,
                 status_code=response.status_code
             )
 
         except requests.exceptions.RequestException as e:
             error_msg = str(e)
-            if hasattr(e.response, 'json'):
+            if getattr(e.response, 'content', None):
                 try:
-                    error_data = e.response.json()
+                    error_data = _loads(e.response.content)
                     error_msg = error_data.get('error', error_msg)
                 except:
                     pass
@@ -67,25 +193,131 @@ class BlendTaggerAPI:
             return APIResponse(
                 success=False,
                 error=error_msg,
-                status_code=e.response.status_code if hasattr(e, 'response') else None
+                status_code=getattr(e.response, 'status_code', None)
+            )
+
+    def _send(self,
+              method: str,
+              url: str,
+              endpoint_name: str,
+              data: Optional[Dict],
+              params: Optional[Dict],
+              headers: Optional[Dict]) -> requests.Response:
+        """Send request, retrying transient failures with backoff"""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(endpoint_name)
+
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=_dumps(data) if data else None,
+                    params=params if params else None,
+                    headers=headers,
+                    timeout=DEFAULT_TIMEOUT
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+                continue
+
+            self.rate_limiter.update_from_headers(endpoint_name, response.headers)
+            if attempt == self.max_retries or not _should_retry(method, response.status_code):
+                return response
+
+            logger.warning(f"Retrying {method} {url} after HTTP {response.status_code}")
+            time.sleep(_backoff_delay(attempt, response.headers.get('Retry-After')))
+
+    async def _make_request_async(self,
+                                  endpoint_name: str,
+                                  data: Optional[Dict] = None,
+                                  params: Optional[Dict] = None,
+                                  **path_params: str) -> APIResponse:
+        """Make HTTP request to a named API endpoint without blocking the event loop"""
+        if aiohttp is None:
+            # No aiohttp available, run the blocking request in a worker thread
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, functools.partial(self._make_request, endpoint_name, data, params,
+                                        **path_params)
             )
 
+        method = endpoints.ENDPOINTS[endpoint_name].method
+        url = self._url_cache[endpoint_name]
+        if path_params:
+            url = url.format(**path_params)
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async(endpoint_name)
+
+            try:
+                async with _get_async_session().request(
+                    method=method,
+                    url=url,
+                    data=_dumps(data) if data else None,
+                    params=params if params else None,
+                    headers=dict(self.session.headers),
+                    timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+                ) as response:
+                    content = await response.read()
+                    status = response.status
+                    reason = response.reason
+                    retry_after = response.headers.get('Retry-After')
+                    self.rate_limiter.update_from_headers(endpoint_name, response.headers)
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+                logger.error(f"API request failed: {str(e)}")
+                return APIResponse(success=False, error=str(e))
+            except aiohttp.ClientError as e:
+                logger.error(f"API request failed: {str(e)}")
+                return APIResponse(success=False, error=str(e))
+
+            if attempt < self.max_retries and _should_retry(method, status):
+                logger.warning(f"Retrying {method} {url} after HTTP {status}")
+                await asyncio.sleep(_backoff_delay(attempt, retry_after))
+                continue
+            break
+
+        if status >= 400:
+            error_msg = f"{status} {reason}"
+            try:
+                error_msg = _loads(content).get('error', error_msg)
+            except (ValueError, AttributeError):
+                pass
+
+            logger.error(f"API request failed: {error_msg}")
+            return APIResponse(
+                success=False,
+                error=error_msg,
+                status_code=status
+            )
+
+        return APIResponse(
+            success=True,
+            data=_loads(content) if content else None,
+            status_code=status
+        )
+
     def submit_annotation(self, data: Dict[str, Any]) -> APIResponse:
         """Submit annotation data to repository"""
-        return self._make_request('POST', endpoints.SUBMIT_ANNOTATION, data=data)
+        return self._make_request('submit_annotation', data=data)
 
     def get_submission_status(self, submission_id: str) -> APIResponse:
         """Get status of a submission"""
-        return self._make_request('GET', f"{endpoints.SUBMISSION_STATUS}/{submission_id}")
+        return self._make_request('get_submission_status', submission_id=submission_id)
 
     def get_dataset_info(self, dataset_id: str) -> APIResponse:
         """Get information about a dataset"""
-        return self._make_request('GET', f"{endpoints.DATASET_INFO}/{dataset_id}")
+        return self._make_request('get_dataset_info', dataset_id=dataset_id)
 
     def list_datasets(self, page: int = 1, per_page: int = 20) -> APIResponse:
         """List available datasets"""
         params = {'page': page, 'per_page': per_page}
-        return self._make_request('GET', endpoints.LIST_DATASETS, params=params)
+        return self._make_request('list_datasets', params=params)
 
     def create_dataset(self, name: str, description: str) -> APIResponse:
         """Create a new dataset"""
@@ -93,23 +325,23 @@ class BlendTaggerAPI:
             'name': name,
             'description': description
         }
-        return self._make_request('POST', endpoints.CREATE_DATASET, data=data)
+        return self._make_request('create_dataset', data=data)
 
     def update_dataset(self, dataset_id: str, data: Dict[str, Any]) -> APIResponse:
         """Update dataset information"""
-        return self._make_request('PUT', f"{endpoints.UPDATE_DATASET}/{dataset_id}", data=data)
+        return self._make_request('update_dataset', data=data, dataset_id=dataset_id)
 
     def delete_submission(self, submission_id: str) -> APIResponse:
         """Delete a submission"""
-        return self._make_request('DELETE', f"{endpoints.DELETE_SUBMISSION}/{submission_id}")
+        return self._make_request('delete_submission', submission_id=submission_id)
 
     def get_user_stats(self) -> APIResponse:
         """Get user statistics"""
-        return self._make_request('GET', endpoints.USER_STATS)
+        return self._make_request('get_user_stats')
 
     def validate_token(self) -> APIResponse:
         """Validate API token"""
-        return self._make_request('GET', endpoints.VALIDATE_TOKEN)
+        return self._make_request('validate_token')
 
     def search_annotations(self,
                          query: str,
@@ -119,44 +351,182 @@ class BlendTaggerAPI:
             'query': query,
             'filters': filters or {}
         }
-        return self._make_request('POST', endpoints.SEARCH_ANNOTATIONS, data=data)
+        return self._make_request('search_annotations', data=data)
 
     def get_annotation_metrics(self, annotation_id: str) -> APIResponse:
         """Get metrics for specific annotation"""
-        return self._make_request('GET', f"{endpoints.ANNOTATION_METRICS}/{annotation_id}")
+        return self._make_request('get_annotation_metrics', annotation_id=annotation_id)
+
+    async def _submit_one(self,
+                          submission: Dict[str, Any],
+                          semaphore: asyncio.Semaphore) -> APIResponse:
+        """Submit a single annotation, bounded by the batch semaphore"""
+        async with semaphore:
+            return await self._make_request_async('submit_annotation', data=submission)
+
+    async def batch_submit_async(self, submissions: List[Dict[str, Any]]) -> List[APIResponse]:
+        """Submit multiple annotations concurrently"""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        return await asyncio.gather(*[self._submit_one(s, semaphore) for s in submissions])
 
     def batch_submit(self, submissions: List[Dict[str, Any]]) -> List[APIResponse]:
         """Submit multiple annotations in batch"""
+        if not submissions:
+            return []
+
+        if self._batch_supported:
+            response = self._make_request('submit_annotation_batch',
+                                          data={'submissions': submissions})
+            if response.status_code != 404:
+                return self._split_batch_response(response, len(submissions))
+            self._batch_supported = False
+
+        async def _run():
+            try:
+                return await self.batch_submit_async(submissions)
+            finally:
+                # The event loop is discarded after this call, so the
+                # session bound to it must be closed as well
+                await _close_async_session()
+
+        return asyncio.run(_run())
+
+    @staticmethod
+    def _split_batch_response(response: APIResponse, count: int) -> List[APIResponse]:
+        """Split a batch submission response into per-submission responses"""
+        results = (response.data or {}).get('results') if response.success else None
+        if not isinstance(results, list) or len(results) != count:
+            if response.success:
+                response = APIResponse(
+                    success=False,
+                    error="Malformed batch response",
+                    status_code=response.status_code
+                )
+            return [response] * count
+
         responses = []
-        for submission in submissions:
-            response = self.submit_annotation(submission)
-            responses.append(response)
+        for result in results:
+            if not isinstance(result, dict):
+                result = {}
+            error = result.get('error')
+            responses.append(APIResponse(
+                success=error is None,
+                data=result if error is None else None,
+                error=error,
+                status_code=result.get('status_code', response.status_code)
+            ))
         return responses
 
+class RateLimiter:
+    """Token bucket rate limiter honoring per-endpoint rate limits"""
+
+    def __init__(self):
+        # endpoint name -> (tokens, last refill time)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _refill(self, name: str, rate_limit: int, now: float) -> float:
+        """Get current token count for an endpoint"""
+        tokens, last_refill = self._buckets.get(name, (float(rate_limit), now))
+        return min(tokens + (now - last_refill) * rate_limit / 60.0, float(rate_limit))
+
+    def _reserve(self, name: str) -> float:
+        """Take a token, returning how long to wait before it is available"""
+        endpoint = endpoints.get_endpoint(name)
+        if endpoint is None or endpoint.rate_limit <= 0:
+            return 0.0
+
+        rate = endpoint.rate_limit / 60.0
+        with self._lock:
+            now = time.monotonic()
+            tokens = self._refill(name, endpoint.rate_limit, now)
+            # Tokens may go negative, reserving future refills for queued callers
+            self._buckets[name] = (tokens - 1.0, now)
+        return (1.0 - tokens) / rate if tokens < 1.0 else 0.0
+
+    def acquire(self, name: str) -> None:
+        """Block until a request to the endpoint is allowed"""
+        wait = self._reserve(name)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, name: str) -> None:
+        """Wait until a request to the endpoint is allowed"""
+        wait = self._reserve(name)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, name: str, headers: Dict[str, str]) -> None:
+        """Adjust tokens from server rate limit headers"""
+        endpoint = endpoints.get_endpoint(name)
+        if endpoint is None or endpoint.rate_limit <= 0:
+            return
+
+        limit = None
+        try:
+            if 'Retry-After' in headers:
+                # Hold off until the server says requests are allowed again
+                limit = 1.0 - float(headers['Retry-After']) * endpoint.rate_limit / 60.0
+            elif 'X-RateLimit-Remaining' in headers:
+                limit = float(headers['X-RateLimit-Remaining'])
+        except ValueError:
+            return  # HTTP-date or malformed values are ignored
+
+        if limit is not None:
+            with self._lock:
+                now = time.monotonic()
+                tokens = self._refill(name, endpoint.rate_limit, now)
+                self._buckets[name] = (min(tokens, limit), now)
+
 class APICache:
     """Cache for API responses"""
     def __init__(self, max_size: int = 100):
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        # key -> (value, timestamp, etag, last_modified)
+        self._cache: 'OrderedDict[str, Tuple[Any, float, Optional[str], Optional[str]]]' = OrderedDict()
         self._max_size = max_size
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, ttl: float = 300) -> Optional[Any]:
         """Get cached value if available"""
-        import time
         if key in self._cache:
-            value, timestamp = self._cache[key]
-            if time.time() - timestamp < 300:  # 5 minute cache
+            value, timestamp, etag, last_modified = self._cache[key]
+            if _monotonic() - timestamp < ttl:
+                self._cache.move_to_end(key)
                 return value
-            del self._cache[key]
+            if etag is None and last_modified is None:
+                del self._cache[key]  # Nothing to revalidate with
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def get_conditional_headers(self, key: str) -> Dict[str, str]:
+        """Get conditional request headers for a cached value"""
+        headers = {}
+        if key in self._cache:
+            _, _, etag, last_modified = self._cache[key]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def revalidate(self, key: str) -> Optional[Any]:
+        """Refresh a cached value confirmed unchanged by the server"""
+        if key not in self._cache:
+            return None
+        value, _, etag, last_modified = self._cache[key]
+        self.set(key, value, etag, last_modified)
+        return value
+
+    def set(self,
+            key: str,
+            value: Any,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
         """Cache a value"""
-        import time
-        if len(self._cache) >= self._max_size:
-            oldest_key = min(self._cache.keys(),
-                           key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-        self._cache[key] = (value, time.time())
+        if key in self._cache:
+            del self._cache[key]
+        elif len(self._cache) >= self._max_size:
+            # Least recently used entry is always first
+            self._cache.popitem(last=False)
+        self._cache[key] = (value, _monotonic(), etag, last_modified)
 
 def register():
     pass  # No registration needed for API client
@@ -1,8 +1,24 @@
-from typing import Dict, Any
-from dataclasses import dataclass
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, Callable, Optional
+from dataclasses import dataclass, field
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    from jsonschema import Draft7Validator, ValidationError
+except ImportError:
+    Draft7Validator = ValidationError = None
+
+# dataclass(slots=True) needs Python 3.10, older Blender builds keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 # Base endpoints
 SUBMIT_ANNOTATION = "annotations/submit"
+SUBMIT_ANNOTATION_BATCH = "annotations/submit_batch"
 SUBMISSION_STATUS = "submissions"
 DATASET_INFO = "datasets"
 LIST_DATASETS = "datasets/list"
@@ -14,7 +30,7 @@ VALIDATE_TOKEN = "auth/validate"
 SEARCH_ANNOTATIONS = "annotations/search"
 ANNOTATION_METRICS = "annotations/metrics"
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class APIEndpoint:
     """API Endpoint definition"""
     path: str
@@ -22,24 +38,44 @@ class APIEndpoint:
     requires_auth: bool = True
     rate_limit: int = 60  # requests per minute
     cache_ttl: int = 300  # cache time to live in seconds
+    _full_path: str = field(init=False, repr=False, compare=False)
+    _formatter: Optional[Callable[[Dict[str, Any]], str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Precompute path strings, endpoints are immutable once defined
+        object.__setattr__(self, '_full_path', f"/v1/{self.path.lstrip('/')}")
+        object.__setattr__(self, '_formatter',
+                           self.path.format_map if '{' in self.path else None)
 
     def get_full_path(self, version: str = "v1") -> str:
         """Get full endpoint path with version"""
+        if version == "v1":
+            return self._full_path
         return f"/{version}/{self.path.lstrip('/')}"
 
 # Detailed endpoint definitions
-ENDPOINTS = {
+ENDPOINTS = MappingProxyType({
     # Annotation endpoints
     "submit_annotation": APIEndpoint(
         path=SUBMIT_ANNOTATION,
         method="POST",
         rate_limit=30
     ),
+    "submit_annotation_batch": APIEndpoint(
+        path=SUBMIT_ANNOTATION_BATCH,
+        method="POST",
+        rate_limit=10
+    ),
     "get_submission_status": APIEndpoint(
         path=SUBMISSION_STATUS + "/{submission_id}",
         method="GET",
         cache_ttl=60
     ),
+    "delete_submission": APIEndpoint(
+        path=DELETE_SUBMISSION + "/{submission_id}",
+        method="DELETE",
+        rate_limit=30
+    ),
 
     # Dataset endpoints
     "get_dataset_info": APIEndpoint(
@@ -87,7 +123,7 @@ ENDPOINTS = {
         method="GET",
         cache_ttl=3600
     ),
-}
+})
 
 def get_endpoint(name: str) -> APIEndpoint:
     """Get endpoint by name"""
@@ -95,7 +131,7 @@ def get_endpoint(name: str) -> APIEndpoint:
 
 def format_path(endpoint: APIEndpoint, **kwargs) -> str:
     """Format endpoint path with parameters"""
-    return endpoint.path.format(**kwargs)
+    return endpoint._formatter(kwargs) if endpoint._formatter else endpoint.path
 
 class APISchemas:
     """API request/response schemas"""
@@ -153,7 +189,12 @@ class APISchemas:
                                     "faces": {
                                         "type": "array",
                                         "items": {"type": "integer"}
-                                    }
+                                    },
+                                    # Packed alternative to the index lists:
+                                    # base64 of little-endian int32 values
+                                    "vertices_blob": {"type": "string"},
+                                    "edges_blob": {"type": "string"},
+                                    "faces_blob": {"type": "string"}
                                 }
                             }
                         },
@@ -201,12 +242,46 @@ class APISchemas:
     @staticmethod
     def validate_submission(data: Dict[str, Any]) -> Tuple[bool, str]:
         """Validate submission data against schema"""
-        from jsonschema import validate, ValidationError
-        try:
-            validate(instance=data, schema=APISchemas.SUBMIT_ANNOTATION_SCHEMA)
-            return True, ""
-        except ValidationError as e:
-            return False, str(e)
+        return _get_validator(APISchemas.SUBMIT_ANNOTATION_SCHEMA)(data)
+
+    @staticmethod
+    def validate_dataset(data: Dict[str, Any]) -> Tuple[bool, str]:
+        """Validate dataset data against schema"""
+        return _get_validator(APISchemas.DATASET_SCHEMA)(data)
+
+# Compiled validators by schema id, built once on first use
+_VALIDATORS: Dict[int, Callable[[Dict[str, Any]], Tuple[bool, str]]] = {}
+
+def _get_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Tuple[bool, str]]:
+    """Get compiled validator for a schema"""
+    validator = _VALIDATORS.get(id(schema))
+    if validator is not None:
+        return validator
+
+    if fastjsonschema is not None:
+        # Generates a specialized Python function for the schema
+        compiled = fastjsonschema.compile(schema)
+
+        def validator(data: Dict[str, Any]) -> Tuple[bool, str]:
+            try:
+                compiled(data)
+                return True, ""
+            except fastjsonschema.JsonSchemaException as e:
+                return False, e.message
+    elif Draft7Validator is not None:
+        compiled = Draft7Validator(schema)
+
+        def validator(data: Dict[str, Any]) -> Tuple[bool, str]:
+            try:
+                compiled.validate(data)
+                return True, ""
+            except ValidationError as e:
+                return False, str(e)
+    else:
+        raise ImportError("fastjsonschema or jsonschema is required for schema validation")
+
+    _VALIDATORS[id(schema)] = validator
+    return validator
 
 def register():
     pass  # No registration needed for endpoints
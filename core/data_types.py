@@ -1,8 +1,103 @@
 import bpy
+import base64
+import numpy as np
+from typing import Dict, Tuple
 from bpy.props import (StringProperty, CollectionProperty,
                       EnumProperty, BoolProperty, FloatVectorProperty,
-                      IntProperty)
+                      IntProperty, PointerProperty)
 from bpy.types import PropertyGroup
+from bpy.app.handlers import persistent
+
+# Mesh annotation indices are stored as packed little-endian int32 arrays.
+# Runs of consecutive indices are stored as (start, length) pairs instead,
+# marked by a leading tag byte; raw arrays are always a multiple of 4 bytes
+INDEX_DTYPE = np.dtype('<i4')
+_RUNS_TAG = b'R'
+
+def decode_indices(blob: str) -> np.ndarray:
+    """Decode a packed index array"""
+    if not blob:
+        return np.empty(0, dtype=INDEX_DTYPE)
+    data = base64.b64decode(blob)
+    if len(data) % 4 != 1 or data[:1] != _RUNS_TAG:
+        return np.frombuffer(data, dtype=INDEX_DTYPE)
+
+    runs = np.frombuffer(data, dtype=INDEX_DTYPE, offset=1).reshape(-1, 2)
+    starts, lengths = runs[:, 0], runs[:, 1]
+    # Each run counts up from its start, offset from the run's position in the output
+    offsets = np.cumsum(lengths) - lengths
+    expanded = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+    return expanded.astype(INDEX_DTYPE)
+
+def encode_indices(indices) -> str:
+    """Encode indices as a packed index array, run-length encoded when that is over 2x smaller"""
+    arr = np.asarray(indices, dtype=INDEX_DTYPE).ravel()
+    data = arr.tobytes()
+    if arr.size > 4:
+        breaks = np.flatnonzero(np.diff(arr) != 1) + 1
+        if 4 * (breaks.size + 1) < arr.size:
+            starts = np.concatenate(([0], breaks))
+            runs = np.empty((starts.size, 2), dtype=INDEX_DTYPE)
+            runs[:, 0] = arr[starts]
+            runs[:, 1] = np.diff(np.append(starts, arr.size))
+            data = _RUNS_TAG + runs.tobytes()
+    return base64.b64encode(data).decode('ascii')
+
+# Mirrors Blender's keyframe interpolation enum so values can be bulk copied
+# from fcurve keyframe points with foreach_get/foreach_set
+INTERPOLATION_ITEMS = [
+    ('CONSTANT', "Constant", "", 0),
+    ('LINEAR', "Linear", "", 1),
+    ('BEZIER', "Bezier", "", 2),
+    ('BACK', "Back", "", 3),
+    ('BOUNCE', "Bounce", "", 4),
+    ('CIRC', "Circular", "", 5),
+    ('CUBIC', "Cubic", "", 6),
+    ('ELASTIC', "Elastic", "", 7),
+    ('EXPO', "Exponential", "", 8),
+    ('QUAD', "Quadratic", "", 9),
+    ('QUART', "Quartic", "", 10),
+    ('QUINT', "Quintic", "", 11),
+    ('SINE', "Sinusoidal", "", 12),
+]
+INTERPOLATION_MODES = {item[0]: item[3] for item in INTERPOLATION_ITEMS}
+INTERPOLATION_NAMES = [item[0] for item in INTERPOLATION_ITEMS]
+
+# Reusable foreach_get/foreach_set buffers, valid until the same key is requested again
+_SCRATCH: Dict[str, np.ndarray] = {}
+
+def scratch_buffer(key: str, dtype: np.dtype, n: int) -> np.ndarray:
+    """Get a reusable uninitialized array of n items"""
+    buf = _SCRATCH.get(key)
+    if buf is None or buf.dtype != dtype or buf.size < n:
+        size = max(n, 2 * buf.size) if buf is not None and buf.dtype == dtype else n
+        buf = _SCRATCH[key] = np.empty(size, dtype=dtype)
+    return buf[:n]
+
+def resize_collection(collection, n: int) -> None:
+    """Grow or shrink a collection to n items, existing items are kept for overwriting"""
+    count = len(collection)
+    if n == 0:
+        collection.clear()
+        return
+
+    # Adding and removing at the end never shifts the other items
+    add = collection.add
+    for _ in range(n - count):
+        add()
+    remove = collection.remove
+    for i in range(count - 1, n - 1, -1):
+        remove(i)
+
+def read_fcurve_keyframes(fcurve) -> Tuple[np.ndarray, np.ndarray]:
+    """Read keyframe coordinates and interpolation modes of an fcurve into scratch buffers"""
+    points = fcurve.keyframe_points
+    n = len(points)
+    co = scratch_buffer("co", np.float32, n * 2)
+    interpolations = scratch_buffer("interpolation", np.int32, n)
+    points.foreach_get("co", co)
+    points.foreach_get("interpolation", interpolations)
+    return co.reshape(n, 2), interpolations
 
 class TagItem(PropertyGroup):
     """Basic tag data structure"""
@@ -17,21 +112,90 @@ class TagItem(PropertyGroup):
 class MeshAnnotation(PropertyGroup):
     """Mesh-specific annotation data"""
     tag: StringProperty(name="Tag")
-    vertex_indices: CollectionProperty(type=PropertyGroup)
-    face_indices: CollectionProperty(type=PropertyGroup)
-    edge_indices: CollectionProperty(type=PropertyGroup)
+    id: StringProperty(name="ID", options={'HIDDEN'})  # UUID hex, stable across reordering
+    # Packed index arrays, base64 encoded since string properties are NUL terminated
+    vertex_indices_blob: StringProperty(name="Vertex Indices", options={'HIDDEN'})
+    face_indices_blob: StringProperty(name="Face Indices", options={'HIDDEN'})
+    edge_indices_blob: StringProperty(name="Edge Indices", options={'HIDDEN'})
+
+    def get_indices(self, kind: str) -> np.ndarray:
+        """Get annotated indices of a component kind ('vertex', 'edge' or 'face')"""
+        return decode_indices(getattr(self, kind + "_indices_blob"))
+
+    def set_indices(self, kind: str, indices) -> None:
+        """Set annotated indices of a component kind ('vertex', 'edge' or 'face')"""
+        setattr(self, kind + "_indices_blob", encode_indices(indices))
+
+    def get_vertex_indices(self) -> np.ndarray:
+        """Get annotated vertex indices"""
+        return self.get_indices("vertex")
+
+    def set_vertex_indices(self, indices) -> None:
+        """Set annotated vertex indices"""
+        self.set_indices("vertex", indices)
+
+    def get_edge_indices(self) -> np.ndarray:
+        """Get annotated edge indices"""
+        return self.get_indices("edge")
+
+    def set_edge_indices(self, indices) -> None:
+        """Set annotated edge indices"""
+        self.set_indices("edge", indices)
+
+    def get_face_indices(self) -> np.ndarray:
+        """Get annotated face indices"""
+        return self.get_indices("face")
+
+    def set_face_indices(self, indices) -> None:
+        """Set annotated face indices"""
+        self.set_indices("face", indices)
 
 class AnimationKeyframe(PropertyGroup):
     """Animation keyframe data"""
     frame: IntProperty(name="Frame")
     value: FloatVectorProperty(name="Value", size=3)
-    interpolation: StringProperty(name="Interpolation")
+    interpolation: EnumProperty(
+        name="Interpolation",
+        items=INTERPOLATION_ITEMS,
+        default='BEZIER'
+    )
 
 class AnimationTrack(PropertyGroup):
     """Animation track data"""
     name: StringProperty(name="Name")
     property_path: StringProperty(name="Property Path")
     keyframes: CollectionProperty(type=AnimationKeyframe)
+    active_keyframe_index: IntProperty(name="Active Keyframe", options={'HIDDEN'})
+
+    def get_keyframes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get keyframe frames, (n, 3) values and interpolation modes as arrays"""
+        keyframes = self.keyframes
+        n = len(keyframes)
+        frames = np.empty(n, dtype=np.int32)
+        values = np.empty(n * 3, dtype=np.float32)
+        interpolations = np.empty(n, dtype=np.int32)
+        if n:
+            keyframes.foreach_get("frame", frames)
+            keyframes.foreach_get("value", values)
+            keyframes.foreach_get("interpolation", interpolations)
+        return frames, values.reshape(n, 3), interpolations
+
+    def set_keyframes(self, frames, values, interpolations) -> None:
+        """Replace keyframes from frame, value and interpolation arrays"""
+        keyframes = self.keyframes
+        n = len(frames)
+        resize_collection(keyframes, n)
+        if not n:
+            return
+
+        frame_buf = scratch_buffer("frames", np.int32, n)
+        frame_buf[:] = frames  # Truncates like int()
+        packed_values = scratch_buffer("values", np.float32, n * 3).reshape(n, 3)
+        packed_values[:, 0] = values  # Value is stored in the first component
+        packed_values[:, 1:] = 0.0
+        keyframes.foreach_set("frame", frame_buf)
+        keyframes.foreach_set("value", packed_values.ravel())
+        keyframes.foreach_set("interpolation", np.asarray(interpolations, dtype=np.int32))
 
 class ObjectAnnotation(PropertyGroup):
     """Complete object annotation including mesh and animation data"""
@@ -40,6 +204,27 @@ class ObjectAnnotation(PropertyGroup):
     animation_tracks: CollectionProperty(type=AnimationTrack)
     metadata: StringProperty(name="Metadata")  # JSON string for additional data
 
+@persistent
+def _migrate_interpolations(_=None) -> None:
+    """Convert keyframe interpolations saved as names by older versions to the enum"""
+    for obj in bpy.data.objects:
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
+            continue
+
+        for track in bt.animation_tracks:
+            # Tracks are written whole, so the first keyframe shows whether the track is old
+            keyframes = track.keyframes
+            if not len(keyframes) or not isinstance(keyframes[0].get("interpolation"), str):
+                continue
+            for keyframe in keyframes:
+                name = keyframe.get("interpolation")
+                if isinstance(name, str):
+                    # The stored string shadows the enum value until it is removed
+                    del keyframe["interpolation"]
+                    if name in INTERPOLATION_MODES:
+                        keyframe.interpolation = name
+
 def register():
     classes = [
         TagItem,
@@ -52,9 +237,14 @@ def register():
         bpy.utils.register_class(cls)
 
     # Register properties
-    bpy.types.Object.blendtagger = bpy.props.PointerProperty(type=ObjectAnnotation)
+    bpy.types.Object.blendtagger = PointerProperty(type=ObjectAnnotation)
+
+    # Files saved before interpolation became an enum store it as a name
+    bpy.app.handlers.load_post.append(_migrate_interpolations)
 
 def unregister():
+    if _migrate_interpolations in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_migrate_interpolations)
     del bpy.types.Object.blendtagger
 
     classes = [
@@ -1,15 +1,50 @@
 import bpy
 import bmesh
 import math
+import numpy as np
 from typing import List, Dict, Any, Tuple, Set, Optional
 from mathutils import Vector, Matrix
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _center_from_indices(coords: np.ndarray,
+                         vidx: np.ndarray,
+                         edge_pairs: np.ndarray,
+                         face_centers: np.ndarray) -> np.ndarray:
+    """Sum vertex positions, edge midpoints and face centers"""
+    total = np.zeros(3)
+    for i in range(vidx.shape[0]):
+        for k in range(3):
+            total[k] += coords[vidx[i], k]
+    for i in range(edge_pairs.shape[0]):
+        for k in range(3):
+            total[k] += 0.5 * (coords[edge_pairs[i, 0], k] + coords[edge_pairs[i, 1], k])
+    for i in range(face_centers.shape[0]):
+        for k in range(3):
+            total[k] += face_centers[i, k]
+    return total
+
+def _interp_vec(v1: np.ndarray, v2: np.ndarray, factor: float) -> np.ndarray:
+    """Linearly interpolate between two vectors"""
+    out = np.empty(v1.shape[0])
+    for i in range(v1.shape[0]):
+        out[i] = v1[i] + factor * (v2[i] - v1[i])
+    return out
+
+# Compile kernels when Numba is available, otherwise callers use NumPy
+_HAS_NUMBA = njit is not None
+if _HAS_NUMBA:
+    _center_from_indices = njit(cache=True, fastmath=True)(_center_from_indices)
+    _interp_vec = njit(cache=True, fastmath=True)(_interp_vec)
+
 def ensure_blendtagger_data(obj: bpy.types.Object) -> None:
     """Ensure object has required BlendTagger data"""
-    if not hasattr(obj, "blendtagger"):
-        obj.blendtagger.tags.clear()
-        obj.blendtagger.mesh_annotations.clear()
-        obj.blendtagger.animation_tracks.clear()
+    # Collections exist empty on every object once registered, so this only reads
+    if getattr(obj, "blendtagger", None) is None:
+        return
 
 def get_mesh_statistics(obj: bpy.types.Object) -> Dict[str, int]:
     """Get mesh component statistics"""
@@ -26,31 +61,63 @@ def get_mesh_statistics(obj: bpy.types.Object) -> Dict[str, int]:
     }
     return stats
 
+# Animation statistics by object session_uid, with the key they were computed for
+_ANIM_STATS_CACHE: Dict[int, Tuple[Tuple, Dict[str, Any]]] = {}
+
 def get_animation_statistics(obj: bpy.types.Object) -> Dict[str, Any]:
     """Get animation data statistics"""
     if not obj.animation_data or not obj.animation_data.action:
         return {}
 
     action = obj.animation_data.action
+    fcurves = action.fcurves
+    fcurve_count = len(fcurves)
+    frame_range = tuple(action.frame_range)
+
+    # Skip the fcurve walk when the action hasn't changed shape
+    key = (action.name, frame_range, fcurve_count)
+    cached = _ANIM_STATS_CACHE.get(obj.session_uid)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
+    # Dict keys dedupe the per-channel data paths while keeping their order
+    properties = {}
+    for fc in fcurves:
+        properties[fc.data_path] = None
+
     stats = {
         'name': action.name,
-        'frame_range': tuple(action.frame_range),
-        'frame_count': int(action.frame_range[1] - action.frame_range[0] + 1),
-        'fcurves': len(action.fcurves),
-        'properties': set(fc.data_path for fc in action.fcurves)
+        'frame_range': frame_range,
+        'frame_count': int(frame_range[1] - frame_range[0] + 1),
+        'fcurves': fcurve_count,
+        'properties': tuple(properties)
     }
-    return stats
+    _ANIM_STATS_CACHE[obj.session_uid] = (key, stats)
+    return dict(stats)
+
+def _valid_indices(indices: List[int], count: int) -> np.ndarray:
+    """Get indices as an array, dropping any out of range"""
+    idx = np.asarray(indices, dtype=np.int64)
+    return idx[(idx >= 0) & (idx < count)]
+
+def _selected_indices(elements: bpy.types.bpy_prop_collection) -> List[int]:
+    """Get indices of selected mesh elements"""
+    sel = np.empty(len(elements), dtype=np.bool_)
+    elements.foreach_get('select', sel)
+    return np.flatnonzero(sel).tolist()
 
 def get_selected_components(obj: bpy.types.Object) -> Dict[str, List[int]]:
     """Get currently selected mesh components"""
     if obj.type != 'MESH' or obj.mode != 'EDIT':
         return {}
 
-    bm = bmesh.from_edit_mesh(obj.data)
+    # Flush the edit mesh selection into mesh data so it can be read in bulk
+    obj.update_from_editmode()
+    mesh = obj.data
     return {
-        'vertices': [v.index for v in bm.verts if v.select],
-        'edges': [e.index for e in bm.edges if e.select],
-        'faces': [f.index for f in bm.faces if f.select]
+        'vertices': _selected_indices(mesh.vertices),
+        'edges': _selected_indices(mesh.edges),
+        'faces': _selected_indices(mesh.polygons)
     }
 
 def create_component_bmesh(obj: bpy.types.Object,
@@ -64,44 +131,51 @@ def create_component_bmesh(obj: bpy.types.Object,
     bm = bmesh.new()
     mesh = obj.data
 
-    # Create vertex lookup dictionary
-    vert_lookup = {}
+    # Mesh vertex index -> new BMVert index, -1 for vertices not copied
+    vert_lookup = np.full(len(mesh.vertices), -1, dtype=np.int32)
 
     # Add vertices
-    if vertices:
-        for v_idx in vertices:
-            if v_idx < len(mesh.vertices):
-                v = mesh.vertices[v_idx]
-                bm_vert = bm.verts.new(v.co)
-                vert_lookup[v_idx] = bm_vert
+    if vertices is not None and len(vertices):
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coords)
+        idx = _valid_indices(vertices, len(mesh.vertices))
+        # Drop repeated indices, keeping first-seen order
+        idx = idx[np.sort(np.unique(idx, return_index=True)[1])]
+
+        new_vert = bm.verts.new
+        for co in coords.reshape(-1, 3)[idx].tolist():
+            new_vert(co)
+        vert_lookup[idx] = np.arange(len(idx), dtype=np.int32)
 
     bm.verts.ensure_lookup_table()
+    bm_verts = bm.verts
+
+    # Add edges whose vertices were both copied
+    if edges is not None and len(edges):
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        pairs = vert_lookup[edge_verts.reshape(-1, 2)[_valid_indices(edges, len(mesh.edges))]]
+
+        new_edge = bm.edges.new
+        for a, b in pairs[(pairs != -1).all(axis=1)].tolist():
+            new_edge((bm_verts[a], bm_verts[b]))
 
-    # Add edges
-    if edges:
-        for e_idx in edges:
-            if e_idx < len(mesh.edges):
-                e = mesh.edges[e_idx]
-                if e.vertices[0] in vert_lookup and e.vertices[1] in vert_lookup:
-                    bm.edges.new((
-                        vert_lookup[e.vertices[0]],
-                        vert_lookup[e.vertices[1]]
-                    ))
-
-    # Add faces
-    if faces:
-        for f_idx in faces:
-            if f_idx < len(mesh.polygons):
-                f = mesh.polygons[f_idx]
-                face_verts = []
-                valid = True
-                for v_idx in f.vertices:
-                    if v_idx not in vert_lookup:
-                        valid = False
-                        break
-                    face_verts.append(vert_lookup[v_idx])
-                if valid:
-                    bm.faces.new(face_verts)
+    # Add faces whose vertices were all copied
+    if faces is not None and len(faces):
+        loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get('loop_start', loop_start)
+        mesh.polygons.foreach_get('loop_total', loop_total)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        mapped = vert_lookup[loop_verts]
+
+        new_face = bm.faces.new
+        for f_idx in _valid_indices(faces, len(mesh.polygons)).tolist():
+            start = loop_start[f_idx]
+            face_verts = mapped[start:start + loop_total[f_idx]]
+            if (face_verts != -1).all():
+                new_face([bm_verts[i] for i in face_verts.tolist()])
 
     return bm
 
@@ -113,31 +187,49 @@ def get_component_center(obj: bpy.types.Object,
     if obj.type != 'MESH':
         return None
 
-    positions = []
     mesh = obj.data
+    coords = np.empty((0, 3), dtype=np.float32)
+    vidx = np.empty(0, dtype=np.int64)
+    edge_pairs = np.empty((0, 2), dtype=np.int32)
+    face_centers = np.empty((0, 3), dtype=np.float32)
+
+    # Index lists or arrays, an array's truth value is ambiguous
+    has_vertices = vertices is not None and len(vertices) > 0
+    has_edges = edges is not None and len(edges) > 0
+    has_faces = faces is not None and len(faces) > 0
+
+    # Bulk read vertex positions once instead of per-index RNA access
+    if has_vertices or has_edges:
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coords)
+        coords = coords.reshape(-1, 3)
 
-    if vertices:
-        positions.extend(mesh.vertices[i].co for i in vertices if i < len(mesh.vertices))
-
-    if edges:
-        for e_idx in edges:
-            if e_idx < len(mesh.edges):
-                edge = mesh.edges[e_idx]
-                center = (mesh.vertices[edge.vertices[0]].co +
-                         mesh.vertices[edge.vertices[1]].co) / 2
-                positions.append(center)
-
-    if faces:
-        for f_idx in faces:
-            if f_idx < len(mesh.polygons):
-                face = mesh.polygons[f_idx]
-                center = face.center
-                positions.append(center)
-
-    if not positions:
+    if has_vertices:
+        vidx = _valid_indices(vertices, len(mesh.vertices))
+
+    if has_edges:
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        edge_pairs = edge_verts.reshape(-1, 2)[_valid_indices(edges, len(mesh.edges))]
+
+    if has_faces:
+        centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+        mesh.polygons.foreach_get('center', centers)
+        face_centers = centers.reshape(-1, 3)[_valid_indices(faces, len(mesh.polygons))]
+
+    count = len(vidx) + len(edge_pairs) + len(face_centers)
+    if count == 0:
         return None
 
-    return sum(positions, Vector()) / len(positions)
+    if _HAS_NUMBA:
+        total = _center_from_indices(coords, vidx, edge_pairs, face_centers)
+    else:
+        # Each edge contributes the midpoint of its two vertices
+        total = (coords[vidx].sum(axis=0, dtype=np.float64) +
+                 coords[edge_pairs].sum(axis=(0, 1), dtype=np.float64) / 2 +
+                 face_centers.sum(axis=0, dtype=np.float64))
+
+    return Vector(total / count)
 
 def interpolate_keyframes(keyframe1: Dict[str, Any],
                          keyframe2: Dict[str, Any],
@@ -146,11 +238,13 @@ def interpolate_keyframes(keyframe1: Dict[str, Any],
     value = None
     if isinstance(keyframe1['value'], (float, int)):
         value = keyframe1['value'] + factor * (keyframe2['value'] - keyframe1['value'])
-    elif isinstance(keyframe1['value'], (list, tuple)):
-        value = [
-            v1 + factor * (v2 - v1)
-            for v1, v2 in zip(keyframe1['value'], keyframe2['value'])
-        ]
+    elif isinstance(keyframe1['value'], (list, tuple, np.ndarray)):
+        v1 = np.asarray(keyframe1['value'], dtype=np.float64)
+        v2 = np.asarray(keyframe2['value'], dtype=np.float64)
+        if _HAS_NUMBA:
+            value = _interp_vec(v1, v2, factor).tolist()
+        else:
+            value = (v1 + factor * (v2 - v1)).tolist()
 
     return {
         'frame': int(keyframe1['frame'] + factor * (keyframe2['frame'] - keyframe1['frame'])),
@@ -175,6 +269,12 @@ def get_keyframe_handles(keyframe: Dict[str, Any]) -> Tuple[Vector, Vector]:
         Vector(keyframe['handle_right'])
     )
 
+def draw_section(layout: bpy.types.UILayout, title: str) -> bpy.types.UILayout:
+    """Draw a titled box and return it for the section's contents"""
+    box = layout.box()
+    box.label(text=title)
+    return box
+
 def register():
     pass  # No registration needed for utility functions
 
@@ -1,6 +1,134 @@
 import bpy
-from typing import List, Dict, Any, Optional, Tuple
-from ..core.data_types import AnimationTrack, AnimationKeyframe
+import heapq
+import re
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, Callable
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from ..properties.scene_props import bump_revision, get_revision
+from ..core.data_types import (AnimationTrack, AnimationKeyframe,
+                               INTERPOLATION_MODES, INTERPOLATION_NAMES,
+                               read_fcurve_keyframes,
+                               scratch_buffer)
+
+# Object session_uid -> track name -> (frames, values, interpolations), dropped by mutators
+_ARRAY_CACHE: Dict[int, Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+
+# Object session_uid -> track name -> start of the last segment returned by a lookup
+_LAST_HIT: Dict[int, Dict[str, int]] = {}
+
+# Revision both caches were filled at, undo, redo and file loads bump it without a mutator
+_cache_revision = -1
+
+def _clear_caches() -> None:
+    """Drop cached keyframe arrays and lookup hints of every object"""
+    _ARRAY_CACHE.clear()
+    _LAST_HIT.clear()
+
+def _get_arrays(obj: bpy.types.Object, track: AnimationTrack) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get cached keyframe arrays of a track, reread after any revision bump"""
+    global _cache_revision
+    revision = get_revision()
+    if revision != _cache_revision:
+        _clear_caches()
+        _cache_revision = revision
+    tracks = _ARRAY_CACHE.setdefault(obj.session_uid, {})
+    arrays = tracks.get(track.name)
+    if arrays is None or len(arrays[0]) != len(track.keyframes):
+        arrays = _read_track(track)
+        tracks[track.name] = arrays
+    return arrays
+
+def invalidate_animation_cache(obj: bpy.types.Object) -> None:
+    """Drop cached keyframe arrays of an object"""
+    _ARRAY_CACHE.pop(obj.session_uid, None)
+    _LAST_HIT.pop(obj.session_uid, None)
+
+def _property_matcher(properties: List[str]) -> Callable[[str], bool]:
+    """Build a test for data paths containing any of the properties"""
+    if not properties:
+        return lambda path: False
+    exact = frozenset(properties)
+    pattern = re.compile("|".join(map(re.escape, properties)))
+    # Exact names are the common case, substrings cover paths like bone channels
+    return lambda path: path in exact or pattern.search(path) is not None
+
+def _read_track(track: AnimationTrack) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read keyframe frames, first value components and interpolations of a track"""
+    keyframes = track.keyframes
+    n = len(keyframes)
+    # Frames and interpolations are cached, only the packed values are temporary
+    frames = np.empty(n, dtype=np.int32)
+    values = scratch_buffer("values", np.float32, n * 3)
+    interpolations = np.empty(n, dtype=np.int32)
+    if n:
+        keyframes.foreach_get("frame", frames)
+        keyframes.foreach_get("value", values)
+        keyframes.foreach_get("interpolation", interpolations)
+    return frames, values[::3].copy(), interpolations
+
+def _velocity_stats(frames: np.ndarray, values: np.ndarray) -> Tuple[float, float, float, int]:
+    """Sum, max, min and count of keyframe velocities in one pass"""
+    total = 0.0
+    vmax = -np.inf
+    vmin = np.inf
+    count = 0
+    for i in range(1, frames.shape[0]):
+        dt = frames[i] - frames[i - 1]
+        if dt > 0:
+            v = abs(values[i] - values[i - 1]) / dt
+            total += v
+            vmax = max(vmax, v)
+            vmin = min(vmin, v)
+            count += 1
+    return total, vmax, vmin, count
+
+def _visvalingam_removed(frames: np.ndarray, values: np.ndarray, min_area: float) -> np.ndarray:
+    """Mask of keyframes removed by Visvalingam-Whyatt, needs three or more keyframes"""
+    n = frames.shape[0]
+    prev_idx = np.arange(-1, n - 1)
+    next_idx = np.arange(1, n + 1)
+    area = np.full(n, np.inf)
+    removed = np.zeros(n, dtype=np.bool_)
+    heap = [(np.inf, 0)]
+    heap.pop()
+    for i in range(1, n - 1):
+        area[i] = 0.5 * abs((frames[i - 1] - frames[i]) * (values[i + 1] - values[i]) -
+                            (frames[i + 1] - frames[i]) * (values[i - 1] - values[i]))
+        heap.append((area[i], i))
+    heapq.heapify(heap)
+
+    while len(heap) > 0 and heap[0][0] < min_area:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != area[i]:
+            continue
+
+        removed[i] = True
+        p = prev_idx[i]
+        q = next_idx[i]
+        next_idx[p] = q
+        prev_idx[q] = p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                b = prev_idx[j]
+                c = next_idx[j]
+                area[j] = max(a, 0.5 * abs((frames[b] - frames[j]) * (values[c] - values[j]) -
+                                           (frames[c] - frames[j]) * (values[b] - values[j])))
+                heapq.heappush(heap, (area[j], j))
+
+    return removed
+
+# Compile kernels when Numba is available, otherwise velocity stats use NumPy
+# and keyframe simplification runs the same kernel uncompiled
+_visvalingam_removed_py = _visvalingam_removed
+_HAS_NUMBA = njit is not None
+if _HAS_NUMBA:
+    _velocity_stats = njit(cache=True, fastmath=True)(_velocity_stats)
+    _visvalingam_removed = njit(cache=True)(_visvalingam_removed)
 
 class AnimationStore:
     """Manages storage and retrieval of animation data"""
@@ -11,7 +139,8 @@ class AnimationStore:
                          end_frame: int = None,
                          properties: List[str] = None) -> bool:
         """Capture animation data for specified properties"""
-        if not hasattr(obj, "blendtagger") or not obj.animation_data or not obj.animation_data.action:
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None or not obj.animation_data or not obj.animation_data.action:
             return False
 
         # Use scene frame range if not specified
@@ -24,43 +153,57 @@ class AnimationStore:
         if properties is None:
             properties = ['location', 'rotation_euler', 'scale']
 
+        invalidate_animation_cache(obj)
         action = obj.animation_data.action
-
-        # Clear existing tracks for properties we're capturing
-        tracks_to_remove = []
-        for i, track in enumerate(obj.blendtagger.animation_tracks):
-            if any(prop in track.property_path for prop in properties):
-                tracks_to_remove.append(i)
-        for i in reversed(tracks_to_remove):
-            obj.blendtagger.animation_tracks.remove(i)
+        tracks = bt.animation_tracks
+        matches = _property_matcher(properties)
+
+        # Clear existing tracks for properties we're capturing. Removing one at a
+        # time shifts the collection each call, so clear and re-add the rest.
+        kept = [(track.name, track.property_path, _read_track(track))
+                for track in tracks if not matches(track.property_path)]
+        tracks.clear()
+        for name, property_path, (frames, values, interpolations) in kept:
+            track = tracks.add()
+            track.name = name
+            track.property_path = property_path
+            track.set_keyframes(frames, values, interpolations)
 
         # Capture new animation data
         for fcurve in action.fcurves:
-            if not any(prop in fcurve.data_path for prop in properties):
+            data_path = fcurve.data_path
+            if not matches(data_path):
                 continue
 
-            track = obj.blendtagger.animation_tracks.add()
-            track.name = f"{fcurve.data_path}[{fcurve.array_index}]"
-            track.property_path = fcurve.data_path
+            track = tracks.add()
+            track.name = f"{data_path}[{fcurve.array_index}]"
+            track.property_path = data_path
 
             # Store keyframes within frame range
-            for keyframe in fcurve.keyframe_points:
-                if start_frame <= keyframe.co.x <= end_frame:
-                    kf = track.keyframes.add()
-                    kf.frame = int(keyframe.co.x)
-                    kf.value[0] = keyframe.co.y  # Store value in first component
-                    kf.interpolation = keyframe.interpolation
-
+            co, interpolations = read_fcurve_keyframes(fcurve)
+            frames = co[:, 0]
+            in_range = np.greater_equal(frames, start_frame)
+            np.logical_and(in_range, frames <= end_frame, out=in_range)
+            if not in_range.all():
+                # Gather the surviving rows once instead of masking each column
+                selected = np.flatnonzero(in_range)
+                co = co[selected]
+                interpolations = interpolations[selected]
+            track.set_keyframes(co[:, 0], co[:, 1], interpolations)
+
+        bump_revision()
         return True
 
     @staticmethod
     def analyze_motion(obj: bpy.types.Object) -> Dict[str, Any]:
         """Analyze captured animation data"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return {}
 
+        tracks = bt.animation_tracks
         analysis = {
-            'track_count': len(obj.blendtagger.animation_tracks),
+            'track_count': len(tracks),
             'keyframe_count': 0,
             'frame_range': (float('inf'), float('-inf')),
             'properties': set(),
@@ -71,39 +214,42 @@ class AnimationStore:
             return analysis
 
         # Collect basic statistics
-        velocities = []
-        prev_frames = {}
+        track_stats = []
+        first_frame = float('inf')
+        last_frame = float('-inf')
 
-        for track in obj.blendtagger.animation_tracks:
+        for track in tracks:
             analysis['properties'].add(track.property_path)
-            analysis['keyframe_count'] += len(track.keyframes)
+            frames, values, _ = _get_arrays(obj, track)
+            analysis['keyframe_count'] += len(frames)
+            if not len(frames):
+                continue
 
-            # Update frame range
-            if track.keyframes:
-                first_frame = track.keyframes[0].frame
-                last_frame = track.keyframes[-1].frame
-                analysis['frame_range'] = (
-                    min(analysis['frame_range'][0], first_frame),
-                    max(analysis['frame_range'][1], last_frame)
-                )
+            # Keyframes are frame sorted, ends give the range
+            first_frame = min(first_frame, int(frames[0]))
+            last_frame = max(last_frame, int(frames[-1]))
 
             # Calculate velocities between keyframes
-            for kf in track.keyframes:
-                if track.property_path in prev_frames:
-                    prev_frame, prev_value = prev_frames[track.property_path]
-                    time_diff = kf.frame - prev_frame
-                    if time_diff > 0:
-                        velocity = abs(kf.value[0] - prev_value) / time_diff
-                        velocities.append(velocity)
-                prev_frames[track.property_path] = (kf.frame, kf.value[0])
+            if _HAS_NUMBA:
+                stats = _velocity_stats(frames.astype(np.float64), values.astype(np.float64))
+            else:
+                dt = np.diff(frames)
+                moving = dt > 0
+                v = np.abs(np.diff(values))[moving] / dt[moving]
+                stats = (float(v.sum()), float(v.max()), float(v.min()), v.size) if v.size else None
+            if stats is not None and stats[3]:
+                track_stats.append(stats)
+
+        analysis['frame_range'] = (first_frame, last_frame)
 
         # Calculate motion metrics
-        if velocities:
+        if track_stats:
+            count = sum(stats[3] for stats in track_stats)
             analysis['metrics'] = {
-                'average_velocity': sum(velocities) / len(velocities),
-                'peak_velocity': max(velocities),
-                'min_velocity': min(velocities),
-                'motion_complexity': len(velocities) / (analysis['frame_range'][1] - analysis['frame_range'][0])
+                'average_velocity': sum(stats[0] for stats in track_stats) / count,
+                'peak_velocity': float(max(stats[1] for stats in track_stats)),
+                'min_velocity': float(min(stats[2] for stats in track_stats)),
+                'motion_complexity': count / (last_frame - first_frame)
             }
 
         return analysis
@@ -113,33 +259,45 @@ class AnimationStore:
                             frame: int,
                             property_path: str) -> Optional[Tuple[float, str]]:
         """Get interpolated value at specific frame"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return None
 
-        for track in obj.blendtagger.animation_tracks:
+        for track in bt.animation_tracks:
             if track.property_path == property_path:
-                # Find surrounding keyframes
-                prev_kf = None
-                next_kf = None
-
-                for kf in track.keyframes:
-                    if kf.frame <= frame:
-                        prev_kf = kf
-                    if kf.frame >= frame:
-                        next_kf = kf
-                        break
-
-                if prev_kf is None or next_kf is None:
+                # Find surrounding keyframes, frames are stored sorted
+                frames, values, interpolations = _get_arrays(obj, track)
+                hits = _LAST_HIT.setdefault(obj.session_uid, {})
+                last = hits.get(track.name)
+                idx = None
+
+                # Sequential playback stays in the last segment or moves to the next one
+                if last is not None:
+                    for start in (last, last + 1):
+                        if start + 1 < len(frames) and frames[start] <= frame <= frames[start + 1]:
+                            idx = start if frames[start] == frame else start + 1
+                            break
+                if idx is None:
+                    idx = int(np.searchsorted(frames, frame))
+                if idx == len(frames):
                     return None
+                if frames[idx] == frame:
+                    prev_idx = idx
+                elif idx > 0:
+                    prev_idx = idx - 1
+                else:
+                    return None
+                hits[track.name] = prev_idx
+                interpolation = INTERPOLATION_NAMES[interpolations[prev_idx]]
 
                 # Linear interpolation between keyframes
-                if prev_kf.frame == next_kf.frame:
-                    return (prev_kf.value[0], prev_kf.interpolation)
+                if frames[prev_idx] == frames[idx]:
+                    return (float(values[prev_idx]), interpolation)
 
-                t = (frame - prev_kf.frame) / (next_kf.frame - prev_kf.frame)
-                value = prev_kf.value[0] + t * (next_kf.value[0] - prev_kf.value[0])
+                t = (frame - frames[prev_idx]) / (frames[idx] - frames[prev_idx])
+                value = values[prev_idx] + t * (values[idx] - values[prev_idx])
 
-                return (value, prev_kf.interpolation)
+                return (float(value), interpolation)
 
         return None
 
@@ -147,29 +305,33 @@ class AnimationStore:
     def optimize_keyframes(obj: bpy.types.Object,
                          tolerance: float = 0.001) -> int:
         """Optimize animation data by removing redundant keyframes"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return 0
 
+        invalidate_animation_cache(obj)
         removed_count = 0
 
-        for track in obj.blendtagger.animation_tracks:
-            i = 1
-            while i < len(track.keyframes) - 1:
-                prev_kf = track.keyframes[i-1]
-                curr_kf = track.keyframes[i]
-                next_kf = track.keyframes[i+1]
-
-                # Calculate expected value at current frame
-                t = (curr_kf.frame - prev_kf.frame) / (next_kf.frame - prev_kf.frame)
-                expected_value = prev_kf.value[0] + t * (next_kf.value[0] - prev_kf.value[0])
-
-                # Check if current keyframe is redundant
-                if abs(curr_kf.value[0] - expected_value) < tolerance:
-                    track.keyframes.remove(i)
-                    removed_count += 1
-                else:
-                    i += 1
+        # Tolerance is the smallest effective triangle area that is kept
+        for track in bt.animation_tracks:
+            n = len(track.keyframes)
+            if n < 3:
+                continue
+
+            frames, values, interpolations = _get_arrays(obj, track)
+            # Compiled with Numba when available, plain Python with heapq otherwise
+            simplify = _visvalingam_removed if _HAS_NUMBA else _visvalingam_removed_py
+            removed = simplify(frames.astype(np.float64), values.astype(np.float64), tolerance)
+            keep = np.flatnonzero(~removed)
+            if len(keep) == n:
+                continue
 
+            track.set_keyframes(frames[keep], values[keep], interpolations[keep])
+            removed_count += n - len(keep)
+
+        invalidate_animation_cache(obj)
+        if removed_count:
+            bump_revision()
         return removed_count
 
     @staticmethod
@@ -177,18 +339,21 @@ class AnimationStore:
                       frame_step: int = 1,
                       properties: List[str] = None) -> bool:
         """Bake animation to regular intervals"""
-        if not hasattr(obj, "blendtagger") or not obj.animation_data:
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None or not obj.animation_data:
             return False
 
+        tracks = bt.animation_tracks
         if properties is None:
             properties = ['location', 'rotation_euler', 'scale']
 
         # Get frame range from existing tracks
         frame_range = None
-        for track in obj.blendtagger.animation_tracks:
-            if track.keyframes:
-                track_start = track.keyframes[0].frame
-                track_end = track.keyframes[-1].frame
+        for track in tracks:
+            frames = _get_arrays(obj, track)[0]
+            if len(frames):
+                track_start = int(frames[0])
+                track_end = int(frames[-1])
                 if frame_range is None:
                     frame_range = [track_start, track_end]
                 else:
@@ -199,7 +364,11 @@ class AnimationStore:
             return False
 
         # Clear existing tracks
-        obj.blendtagger.animation_tracks.clear()
+        invalidate_animation_cache(obj)
+        tracks.clear()
+
+        frames = np.arange(frame_range[0], frame_range[1] + 1, frame_step, dtype=np.int32)
+        linear = np.full(len(frames), INTERPOLATION_MODES['LINEAR'], dtype=np.int32)
 
         # Create new tracks with baked keyframes
         for prop in properties:
@@ -207,22 +376,21 @@ class AnimationStore:
                       if fc.data_path == prop]
 
             for fc_idx, fcurve in enumerate(fcurves):
-                track = obj.blendtagger.animation_tracks.add()
+                track = tracks.add()
                 track.name = f"{prop}[{fc_idx}]"
                 track.property_path = prop
 
                 # Bake keyframes at regular intervals
-                for frame in range(frame_range[0], frame_range[1] + 1, frame_step):
-                    value = fcurve.evaluate(frame)
-                    kf = track.keyframes.add()
-                    kf.frame = frame
-                    kf.value[0] = value
-                    kf.interpolation = 'LINEAR'
+                evaluate = fcurve.evaluate
+                values = np.fromiter((evaluate(f) for f in frames.tolist()),
+                                     dtype=np.float32, count=len(frames))
+                track.set_keyframes(frames, values, linear)
 
+        bump_revision()
         return True
 
 def register():
     pass  # No registration needed for this module
 
 def unregister():
-    pass
+    _clear_caches()
@@ -1,7 +1,53 @@
 import bpy
-import bmesh
-from typing import List, Dict, Any, Optional
-from ..core.data_types import TagItem, MeshAnnotation
+import uuid
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence
+from ..core.data_types import TagItem, MeshAnnotation, INDEX_DTYPE
+from ..core.utils import _selected_indices, _valid_indices
+from ..properties.scene_props import bump_revision
+
+def _index_mask(indices: Optional[Sequence[int]], count: int) -> np.ndarray:
+    """Build a selection mask from element indices"""
+    mask = np.zeros(count, dtype=np.bool_)
+    if indices is not None and len(indices):
+        mask[_valid_indices(indices, count)] = True
+    return mask
+
+# Object session_uid -> tag name -> index of its first tag
+_TAG_INDEX: Dict[int, Dict[str, int]] = {}
+
+def _find_tag(obj: bpy.types.Object, tag_name: str) -> Optional[int]:
+    """Get the index of the first tag with a name"""
+    tags = obj.blendtagger.tags
+    index = _TAG_INDEX.get(obj.session_uid)
+    if index is not None:
+        idx = index.get(tag_name)
+        if idx is not None and idx < len(tags) and tags[idx].name == tag_name:
+            return idx
+
+    # Missing or stale, tags may also be edited outside the store
+    index = {}
+    for i, tag in enumerate(tags):
+        index.setdefault(tag.name, i)
+    _TAG_INDEX[obj.session_uid] = index
+    return index.get(tag_name)
+
+# Object session_uid -> mesh annotation id -> index
+_ANNOTATION_INDEX: Dict[int, Dict[str, int]] = {}
+
+def find_mesh_annotation(obj: bpy.types.Object, annotation_id: str) -> Optional[int]:
+    """Get the index of the mesh annotation with an id"""
+    annotations = obj.blendtagger.mesh_annotations
+    index = _ANNOTATION_INDEX.get(obj.session_uid)
+    if index is not None:
+        idx = index.get(annotation_id)
+        if idx is not None and idx < len(annotations) and annotations[idx].id == annotation_id:
+            return idx
+
+    # Missing or stale, annotations are removed and reordered outside the store
+    index = {annotation.id: i for i, annotation in enumerate(annotations) if annotation.id}
+    _ANNOTATION_INDEX[obj.session_uid] = index
+    return index.get(annotation_id)
 
 class AnnotationStore:
     """Manages storage and retrieval of annotation data"""
@@ -9,57 +55,70 @@ class AnnotationStore:
     @staticmethod
     def add_tag(obj: bpy.types.Object, tag_name: str, color: tuple = (1.0, 1.0, 1.0)) -> Optional[TagItem]:
         """Add a new tag to an object"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return None
 
-        tag = obj.blendtagger.tags.add()
+        tags = bt.tags
+        tag = tags.add()
         tag.name = tag_name
         tag.color = color
+
+        index = _TAG_INDEX.get(obj.session_uid)
+        if index is not None:
+            index.setdefault(tag_name, len(tags) - 1)
+        bump_revision()
         return tag
 
     @staticmethod
     def remove_tag(obj: bpy.types.Object, tag_name: str) -> bool:
         """Remove a tag from an object"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return False
 
-        for i, tag in enumerate(obj.blendtagger.tags):
-            if tag.name == tag_name:
-                obj.blendtagger.tags.remove(i)
-                return True
-        return False
+        idx = _find_tag(obj, tag_name)
+        if idx is None:
+            return False
+
+        bt.tags.remove(idx)
+        # Later tags shift down, a duplicate of the removed name is found by a rebuild
+        _TAG_INDEX[obj.session_uid] = {
+            name: i - 1 if i > idx else i
+            for name, i in _TAG_INDEX[obj.session_uid].items() if name != tag_name
+        }
+        bump_revision()
+        return True
 
     @staticmethod
     def add_mesh_annotation(obj: bpy.types.Object,
                           tag: str,
-                          vertices: List[int] = None,
-                          edges: List[int] = None,
-                          faces: List[int] = None) -> Optional[MeshAnnotation]:
+                          vertices: Sequence[int] = None,
+                          edges: Sequence[int] = None,
+                          faces: Sequence[int] = None) -> Optional[MeshAnnotation]:
         """Add a new mesh annotation"""
-        if not hasattr(obj, "blendtagger") or obj.type != 'MESH':
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None or obj.type != 'MESH':
             return None
 
-        annotation = obj.blendtagger.mesh_annotations.add()
+        annotations = bt.mesh_annotations
+        annotation = annotations.add()
         annotation.tag = tag
+        annotation.id = uuid.uuid4().hex
 
-        # Add vertex indices
-        if vertices:
-            for v_idx in vertices:
-                idx = annotation.vertex_indices.add()
-                idx.value = v_idx
-
-        # Add edge indices
-        if edges:
-            for e_idx in edges:
-                idx = annotation.edge_indices.add()
-                idx.value = e_idx
+        index = _ANNOTATION_INDEX.get(obj.session_uid)
+        if index is not None:
+            index[annotation.id] = len(annotations) - 1
 
-        # Add face indices
-        if faces:
-            for f_idx in faces:
-                idx = annotation.face_indices.add()
-                idx.value = f_idx
+        # Add component indices, lists or index arrays are packed in one go
+        if vertices is not None and len(vertices):
+            annotation.set_vertex_indices(vertices)
+        if edges is not None and len(edges):
+            annotation.set_edge_indices(edges)
+        if faces is not None and len(faces):
+            annotation.set_face_indices(faces)
 
+        bump_revision()
         return annotation
 
     @staticmethod
@@ -68,72 +127,82 @@ class AnnotationStore:
         if obj.type != 'MESH' or obj.mode != 'EDIT':
             return {}
 
-        bm = bmesh.from_edit_mesh(obj.data)
+        # Read the select mode once and flush the edit mesh so selection can be read in bulk
+        vert_mode, edge_mode, face_mode = bpy.context.tool_settings.mesh_select_mode
+        obj.update_from_editmode()
+        mesh = obj.data
         result = {
-            'vertices': [],
-            'edges': [],
-            'faces': []
+            'vertices': _selected_indices(mesh.vertices) if vert_mode else [],
+            'edges': _selected_indices(mesh.edges) if edge_mode else [],
+            'faces': _selected_indices(mesh.polygons) if face_mode else []
         }
 
-        # Get selection based on current mode
-        if bpy.context.tool_settings.mesh_select_mode[0]:  # Vertex mode
-            result['vertices'] = [v.index for v in bm.verts if v.select]
-        if bpy.context.tool_settings.mesh_select_mode[1]:  # Edge mode
-            result['edges'] = [e.index for e in bm.edges if e.select]
-        if bpy.context.tool_settings.mesh_select_mode[2]:  # Face mode
-            result['faces'] = [f.index for f in bm.faces if f.select]
-
         return result
 
     @staticmethod
     def select_components(obj: bpy.types.Object,
-                        vertices: List[int] = None,
-                        edges: List[int] = None,
-                        faces: List[int] = None) -> bool:
-        """Select specified mesh components"""
+                        vertices: Sequence[int] = None,
+                        edges: Sequence[int] = None,
+                        faces: Sequence[int] = None,
+                        stay_in_object_mode: bool = False) -> bool:
+        """Select specified mesh components, ending in edit mode unless stay_in_object_mode is set"""
         if obj.type != 'MESH':
             return False
 
-        # Ensure we're in edit mode
-        if obj.mode != 'EDIT':
-            bpy.ops.object.mode_set(mode='EDIT')
-
-        bm = bmesh.from_edit_mesh(obj.data)
-
-        # Clear current selection
-        bpy.ops.mesh.select_all(action='DESELECT')
-
-        # Select vertices
-        if vertices:
-            for idx in vertices:
-                if idx < len(bm.verts):
-                    bm.verts[idx].select = True
-
-        # Select edges
-        if edges:
-            for idx in edges:
-                if idx < len(bm.edges):
-                    bm.edges[idx].select = True
-
-        # Select faces
-        if faces:
-            for idx in faces:
-                if idx < len(bm.faces):
-                    bm.faces[idx].select = True
+        # Nothing to select, skip the mode switch round trip
+        if not any(indices is not None and len(indices) for indices in (vertices, edges, faces)):
+            return True
 
-        bmesh.update_edit_mesh(obj.data)
+        # Write selection to mesh data in object mode, edit mode reads it back on entry
+        if obj.mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        mesh = obj.data
+        vert_mask = _index_mask(vertices, len(mesh.vertices))
+        edge_mask = _index_mask(edges, len(mesh.edges))
+        face_mask = _index_mask(faces, len(mesh.polygons))
+
+        # Selected faces select their edges and vertices, as bmesh does
+        if face_mask.any():
+            loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", loop_total)
+            loop_selected = np.repeat(face_mask, loop_total)
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            mesh.loops.foreach_get("edge_index", loop_edges)
+            vert_mask[loop_verts[loop_selected]] = True
+            edge_mask[loop_edges[loop_selected]] = True
+
+        # Selected edges select their vertices
+        if edge_mask.any():
+            edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", edge_verts)
+            vert_mask[edge_verts.reshape(-1, 2)[edge_mask].ravel()] = True
+
+        mesh.vertices.foreach_set("select", vert_mask)
+        mesh.edges.foreach_set("select", edge_mask)
+        mesh.polygons.foreach_set("select", face_mask)
+
+        if stay_in_object_mode:
+            mesh.update()
+        else:
+            bpy.ops.object.mode_set(mode='EDIT')
         return True
 
     @staticmethod
     def get_annotation_stats(obj: bpy.types.Object) -> Dict[str, Any]:
         """Get statistics about object's annotations"""
-        if not hasattr(obj, "blendtagger"):
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None:
             return {}
 
+        tags = bt.tags
+        annotations = bt.mesh_annotations
         stats = {
-            'tag_count': len(obj.blendtagger.tags),
-            'tags': [tag.name for tag in obj.blendtagger.tags],
-            'mesh_annotations': len(obj.blendtagger.mesh_annotations) if obj.type == 'MESH' else 0,
+            'tag_count': len(tags),
+            'tags': [tag.name for tag in tags],
+            'mesh_annotations': len(annotations) if obj.type == 'MESH' else 0,
             'components': {
                 'vertices': 0,
                 'edges': 0,
@@ -143,46 +212,49 @@ class AnnotationStore:
 
         # Count annotated components
         if obj.type == 'MESH':
-            for ann in obj.blendtagger.mesh_annotations:
-                stats['components']['vertices'] += len(ann.vertex_indices)
-                stats['components']['edges'] += len(ann.edge_indices)
-                stats['components']['faces'] += len(ann.face_indices)
+            for ann in annotations:
+                stats['components']['vertices'] += len(ann.get_vertex_indices())
+                stats['components']['edges'] += len(ann.get_edge_indices())
+                stats['components']['faces'] += len(ann.get_face_indices())
 
         return stats
 
     @staticmethod
     def merge_annotations(obj: bpy.types.Object, tag_name: str) -> bool:
         """Merge all annotations with the same tag"""
-        if not hasattr(obj, "blendtagger") or obj.type != 'MESH':
+        bt = getattr(obj, "blendtagger", None)
+        if bt is None or obj.type != 'MESH':
             return False
 
-        merged = {
-            'vertices': set(),
-            'edges': set(),
-            'faces': set()
-        }
-
         # Collect all components with the same tag
+        annotations = bt.mesh_annotations
         indices_to_remove = []
-        for i, ann in enumerate(obj.blendtagger.mesh_annotations):
+        vertices, edges, faces = [], [], []
+        for i, ann in enumerate(annotations):
             if ann.tag == tag_name:
-                merged['vertices'].update(idx.value for idx in ann.vertex_indices)
-                merged['edges'].update(idx.value for idx in ann.edge_indices)
-                merged['faces'].update(idx.value for idx in ann.face_indices)
+                vertices.append(ann.get_vertex_indices())
+                edges.append(ann.get_edge_indices())
+                faces.append(ann.get_face_indices())
                 indices_to_remove.append(i)
 
         # Remove old annotations
         for i in reversed(indices_to_remove):
-            obj.blendtagger.mesh_annotations.remove(i)
+            annotations.remove(i)
+        if indices_to_remove:
+            bump_revision()
+
+        # Sort and deduplicate each component type in one pass
+        merged = [np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=INDEX_DTYPE)
+                  for arrays in (vertices, edges, faces)]
 
         # Create new merged annotation
-        if any(merged.values()):
+        if any(arr.size for arr in merged):
             AnnotationStore.add_mesh_annotation(
                 obj,
                 tag_name,
-                vertices=list(merged['vertices']),
-                edges=list(merged['edges']),
-                faces=list(merged['faces'])
+                vertices=merged[0],
+                edges=merged[1],
+                faces=merged[2]
             )
             return True
 
@@ -2,9 +2,74 @@ import bpy
 import json
 import csv
 import io
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Iterator, Iterable, Union, TextIO
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy arrays and scalars for the stdlib JSON encoder"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _encode_indented(value: Any) -> str:
+    """Encode a value as JSON indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(value, indent=2, default=_json_default)
+
+def write_json_stream(f: TextIO, header: Dict[str, Any], objects: Iterable[Dict[str, Any]]) -> int:
+    """Write header fields and an "objects" array, encoding one object at a time, strings are written as is"""
+    f.write('{\n')
+    for key, value in header.items():
+        f.write(f'  {json.dumps(key)}: {_encode_indented(value)},\n')
+    f.write('  "objects": [')
+    count = 0
+    for obj in objects:
+        f.write(',\n    ' if count else '\n    ')
+        f.write(obj if isinstance(obj, str) else _encode_indented(obj).replace('\n', '\n    '))
+        count += 1
+    f.write('\n  ]\n}\n' if count else ']\n}\n')
+    return count
+
+# 2.0 stores track keyframes as parallel frame/value/interpolation lists
+JSON_FORMAT_VERSION = "2.0"
+
+def keyframe_columns(keyframes: Union[List[Dict[str, Any]], Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
+    """Get keyframes as parallel frame, value and interpolation lists"""
+    if isinstance(keyframes, dict):
+        return keyframes
+
+    frames = []
+    values = []
+    interpolations = []
+    for kf in keyframes:
+        frames.append(kf.get("frame", 0))
+        values.append(kf.get("value", [0, 0, 0]))
+        interpolations.append(kf.get("interpolation", "LINEAR"))
+    return {"frame": frames, "value": values, "interpolation": interpolations}
+
+def keyframe_records(keyframes: Union[List[Dict[str, Any]], Dict[str, List[Any]]]) -> List[Dict[str, Any]]:
+    """Get keyframes as one dict per keyframe, for readers of the 1.0 layout"""
+    if not isinstance(keyframes, dict):
+        return list(keyframes)
+    return [
+        {"frame": frame, "value": value, "interpolation": interpolation}
+        for frame, value, interpolation in zip(keyframes["frame"],
+                                               keyframes["value"],
+                                               keyframes["interpolation"])
+    ]
+
+ZERO_LOCATION = (0.0, 0.0, 0.0)
+
+def _format_floats(values) -> str:
+    """Join floats compactly, without trailing zeros"""
+    return ",".join([format(v, ".6g") for v in values])
+
 class ExportFormat:
     """Base class for export formats"""
     @staticmethod
@@ -23,73 +88,78 @@ class JSONFormat(ExportFormat):
     """JSON export format handler"""
 
     @staticmethod
-    def format_data(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format data for JSON export"""
-        formatted = {
-            "format_version": "1.0",
+    def format_header(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format top level export fields"""
+        return {
+            "format_version": JSON_FORMAT_VERSION,
             "blender_version": bpy.app.version_string,
             "timestamp": bpy.context.scene.get("blendtagger_export_time", ""),
-            "scene": data.get("scene", ""),
-            "objects": []
+            "scene": data.get("scene", "")
         }
 
-        for obj_data in data.get("objects", []):
-            formatted_obj = {
-                "name": obj_data.get("name", ""),
-                "type": obj_data.get("type", ""),
-                "tags": [{"name": tag.get("name", ""),
-                         "color": tag.get("color", [1, 1, 1])}
-                        for tag in obj_data.get("tags", [])],
-                "transform": {
-                    "location": obj_data.get("location", [0, 0, 0]),
-                    "rotation": obj_data.get("rotation", [0, 0, 0]),
-                    "scale": obj_data.get("scale", [1, 1, 1])
-                }
+    @staticmethod
+    def format_object(obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a single object for JSON export"""
+        formatted_obj = {
+            "name": obj_data.get("name", ""),
+            "type": obj_data.get("type", ""),
+            "tags": [{"name": tag.get("name", ""),
+                     "color": tag.get("color", [1, 1, 1])}
+                    for tag in obj_data.get("tags", [])],
+            "transform": {
+                "location": obj_data.get("location", [0, 0, 0]),
+                "rotation": obj_data.get("rotation", [0, 0, 0]),
+                "scale": obj_data.get("scale", [1, 1, 1])
             }
+        }
 
-            # Add mesh annotations if present
-            if "mesh_annotations" in obj_data:
-                formatted_obj["mesh_annotations"] = [
-                    {
-                        "tag": ann.get("tag", ""),
-                        "components": {
-                            "vertices": ann.get("vertices", []),
-                            "edges": ann.get("edges", []),
-                            "faces": ann.get("faces", [])
-                        }
-                    }
-                    for ann in obj_data["mesh_annotations"]
-                ]
-
-            # Add animation data if present
-            if "animation_tracks" in obj_data:
-                formatted_obj["animation"] = [
-                    {
-                        "track_name": track.get("name", ""),
-                        "property": track.get("property", ""),
-                        "keyframes": [
-                            {
-                                "frame": kf.get("frame", 0),
-                                "value": kf.get("value", [0, 0, 0]),
-                                "interpolation": kf.get("interpolation", "LINEAR")
-                            }
-                            for kf in track.get("keyframes", [])
-                        ]
+        # Add mesh annotations if present
+        if "mesh_annotations" in obj_data:
+            formatted_obj["mesh_annotations"] = [
+                {
+                    "tag": ann.get("tag", ""),
+                    "components": {
+                        "vertices": ann.get("vertices", []),
+                        "edges": ann.get("edges", []),
+                        "faces": ann.get("faces", [])
                     }
-                    for track in obj_data["animation_tracks"]
-                ]
+                }
+                for ann in obj_data["mesh_annotations"]
+            ]
+
+        # Add animation data if present
+        if "animation_tracks" in obj_data:
+            formatted_obj["animation"] = [
+                {
+                    "track_name": track.get("name", ""),
+                    "property": track.get("property", ""),
+                    "keyframes": keyframe_columns(track.get("keyframes", []))
+                }
+                for track in obj_data["animation_tracks"]
+            ]
 
-            formatted["objects"].append(formatted_obj)
+        return formatted_obj
 
+    @staticmethod
+    def iter_objects(data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield formatted objects one at a time"""
+        for obj_data in data.get("objects", []):
+            yield JSONFormat.format_object(obj_data)
+
+    @staticmethod
+    def format_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Format data for JSON export"""
+        formatted = JSONFormat.format_header(data)
+        formatted["objects"] = list(JSONFormat.iter_objects(data))
         return formatted
 
     @staticmethod
     def export(data: Dict[str, Any], filepath: str) -> bool:
         """Export data in JSON format"""
         try:
-            formatted_data = JSONFormat.format_data(data)
+            # Objects are encoded one at a time so only one is held formatted
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(formatted_data, f, indent=2)
+                write_json_stream(f, JSONFormat.format_header(data), JSONFormat.iter_objects(data))
             return True
         except Exception as e:
             print(f"JSON export failed: {str(e)}")
@@ -118,6 +188,20 @@ class CSVFormat(ExportFormat):
             "keyframe_interpolation"
         ]
 
+    @staticmethod
+    def object_columns(obj_data: Dict[str, Any], tag: Dict[str, Any] = None) -> List[str]:
+        """Format the object and tag columns of a CSV row"""
+        x, y, z = obj_data.get("location") or ZERO_LOCATION
+        return [
+            obj_data.get("name", ""),
+            obj_data.get("type", ""),
+            tag.get("name", "") if tag else "",
+            _format_floats(tag.get("color") or ()) if tag else "",
+            format(x, ".6g"),
+            format(y, ".6g"),
+            format(z, ".6g"),
+        ]
+
     @staticmethod
     def format_row(obj_data: Dict[str, Any],
                   tag: Dict[str, Any] = None,
@@ -125,21 +209,13 @@ class CSVFormat(ExportFormat):
                   track: Dict[str, Any] = None,
                   keyframe: Dict[str, Any] = None) -> List[str]:
         """Format a single CSV row"""
-        row = [
-            obj_data.get("name", ""),
-            obj_data.get("type", ""),
-            tag.get("name", "") if tag else "",
-            ",".join(map(str, tag.get("color", []))) if tag else "",
-            str(obj_data.get("location", [0, 0, 0])[0]),
-            str(obj_data.get("location", [0, 0, 0])[1]),
-            str(obj_data.get("location", [0, 0, 0])[2]),
-        ]
+        row = CSVFormat.object_columns(obj_data, tag)
 
         # Add annotation data
         if annotation:
             row.extend([
                 annotation.get("type", ""),
-                ",".join(map(str, annotation.get("indices", [])))
+                ",".join(map(str, annotation.get("indices") or ()))
             ])
         else:
             row.extend(["", ""])
@@ -150,7 +226,7 @@ class CSVFormat(ExportFormat):
                 track.get("name", ""),
                 track.get("property", ""),
                 str(keyframe.get("frame", 0)),
-                ",".join(map(str, keyframe.get("value", []))),
+                ",".join(map(str, keyframe.get("value") or ())),
                 keyframe.get("interpolation", "")
             ])
         else:
@@ -167,26 +243,34 @@ class CSVFormat(ExportFormat):
                 writer.writerow(CSVFormat.get_headers())
 
                 for obj_data in data.get("objects", []):
+                    # Object columns are shared by every non-tag row of the object
+                    base = CSVFormat.object_columns(obj_data)
+
                     # Write basic object and tag data
-                    for tag in obj_data.get("tags", []):
-                        writer.writerow(CSVFormat.format_row(obj_data, tag=tag))
+                    writer.writerows(
+                        CSVFormat.object_columns(obj_data, tag) + ["", "", "", "", "", "", ""]
+                        for tag in obj_data.get("tags", [])
+                    )
 
                     # Write mesh annotations
-                    for ann in obj_data.get("mesh_annotations", []):
-                        for comp_type in ["vertices", "edges", "faces"]:
-                            if ann.get(comp_type):
-                                annotation = {
-                                    "type": comp_type,
-                                    "indices": ann[comp_type]
-                                }
-                                writer.writerow(CSVFormat.format_row(
-                                    obj_data, annotation=annotation))
+                    writer.writerows(
+                        base + [comp_type, ",".join(map(str, ann[comp_type])), "", "", "", "", ""]
+                        for ann in obj_data.get("mesh_annotations", [])
+                        for comp_type in ("vertices", "edges", "faces")
+                        if ann.get(comp_type)
+                    )
 
                     # Write animation data
                     for track in obj_data.get("animation_tracks", []):
-                        for kf in track.get("keyframes", []):
-                            writer.writerow(CSVFormat.format_row(
-                                obj_data, track=track, keyframe=kf))
+                        track_columns = ["", "", track.get("name", ""), track.get("property", "")]
+                        writer.writerows(
+                            base + track_columns + [
+                                str(kf.get("frame", 0)),
+                                ",".join(map(str, kf.get("value", []))),
+                                kf.get("interpolation", "")
+                            ]
+                            for kf in keyframe_records(track.get("keyframes", []))
+                        )
 
             return True
         except Exception as e:
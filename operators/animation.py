@@ -2,6 +2,9 @@
 import bpy
 from bpy.props import StringProperty, BoolProperty
 from bpy.types import Operator
+from ..core.data_types import read_fcurve_keyframes
+from ..data.animation_store import invalidate_animation_cache
+from ..properties.scene_props import bump_revision
 
 class BLENDTAGGER_OT_capture_animation(Operator):
     """Captures animation data for the selected object"""
@@ -35,31 +38,34 @@ class BLENDTAGGER_OT_capture_animation(Operator):
         action = obj.animation_data.action
 
         # Clear existing tracks
-        obj.blendtagger.animation_tracks.clear()
+        invalidate_animation_cache(obj)
+        tracks = obj.blendtagger.animation_tracks
+        tracks.clear()
+
+        # Curves excluded by settings, resolved once for all fcurves
+        excluded = frozenset(path for path, include in (
+            ("location", self.include_location),
+            ("rotation_euler", self.include_rotation),
+            ("scale", self.include_scale),
+        ) if not include)
 
         # Capture fcurves based on settings
         for fcurve in action.fcurves:
-            # Check if we should include this curve based on settings
-            if fcurve.data_path == "location" and not self.include_location:
-                continue
-            if fcurve.data_path == "rotation_euler" and not self.include_rotation:
-                continue
-            if fcurve.data_path == "scale" and not self.include_scale:
+            data_path = fcurve.data_path
+            if data_path in excluded:
                 continue
 
             # Create new track
-            track = obj.blendtagger.animation_tracks.add()
-            track.name = f"{fcurve.data_path}[{fcurve.array_index}]"
-            track.property_path = fcurve.data_path
+            track = tracks.add()
+            track.name = f"{data_path}[{fcurve.array_index}]"
+            track.property_path = data_path
 
             # Store keyframes
-            for keyframe in fcurve.keyframe_points:
-                kf = track.keyframes.add()
-                kf.frame = int(keyframe.co.x)
-                kf.value[0] = keyframe.co.y
-                kf.interpolation = keyframe.interpolation
+            co, interpolations = read_fcurve_keyframes(fcurve)
+            track.set_keyframes(co[:, 0], co[:, 1], interpolations)
 
-        self.report({'INFO'}, f"Captured animation data with {len(obj.blendtagger.animation_tracks)} tracks")
+        bump_revision()
+        self.report({'INFO'}, f"Captured animation data with {len(tracks)} tracks")
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -75,7 +81,9 @@ class BLENDTAGGER_OT_clear_animation_data(Operator):
         if not obj:
             return {'CANCELLED'}
 
+        invalidate_animation_cache(obj)
         obj.blendtagger.animation_tracks.clear()
+        bump_revision()
         self.report({'INFO'}, "Cleared animation data")
         return {'FINISHED'}
 
@@ -1,7 +1,10 @@
 import bpy
-import bmesh
+import uuid
 from bpy.props import StringProperty, IntProperty, FloatVectorProperty
 from bpy.types import Operator
+from ..core.utils import _selected_indices
+from ..data.annotation_store import AnnotationStore, find_mesh_annotation
+from ..properties.scene_props import bump_revision
 
 class BLENDTAGGER_OT_add_tag(Operator):
     """Add a new tag to the active object"""
@@ -31,6 +34,7 @@ class BLENDTAGGER_OT_add_tag(Operator):
         tag = obj.blendtagger.tags.add()
         tag.name = self.tag_name
         tag.color = self.tag_color
+        bump_revision()
 
         return {'FINISHED'}
 
@@ -43,6 +47,13 @@ class BLENDTAGGER_OT_remove_tag(Operator):
     bl_label = "Remove Tag"
     bl_options = {'REGISTER', 'UNDO'}
 
+    tag_index: IntProperty(
+        name="Tag Index",
+        description="Index of the tag to remove, -1 to look it up by name",
+        default=-1
+    )
+
+    # Deprecated, kept for callers that still remove tags by name
     tag_name: StringProperty(
         name="Tag Name",
         description="Name of the tag to remove"
@@ -53,11 +64,14 @@ class BLENDTAGGER_OT_remove_tag(Operator):
         if not obj:
             return {'CANCELLED'}
 
-        # Find and remove tag
-        for i, tag in enumerate(obj.blendtagger.tags):
-            if tag.name == self.tag_name:
-                obj.blendtagger.tags.remove(i)
-                break
+        # Remove by index, falling back to a name lookup in the collection's C code
+        tags = obj.blendtagger.tags
+        idx = self.tag_index
+        if idx < 0:
+            idx = tags.find(self.tag_name)
+        if 0 <= idx < len(tags):
+            tags.remove(idx)
+            bump_revision()
 
         return {'FINISHED'}
 
@@ -78,33 +92,25 @@ class BLENDTAGGER_OT_add_mesh_annotation(Operator):
             self.report({'ERROR'}, "Must be in edit mode on a mesh object")
             return {'CANCELLED'}
 
-        # Get bmesh for current edit mode mesh
-        bm = bmesh.from_edit_mesh(obj.data)
+        # Flush the edit mesh so selection can be read in bulk from mesh data
+        obj.update_from_editmode()
+        mesh = obj.data
 
         # Create new annotation
         annotation = obj.blendtagger.mesh_annotations.add()
         annotation.tag = self.tag
+        annotation.id = uuid.uuid4().hex
+        bump_revision()
+
+        # Store selected elements for every active selection mode
+        vert_mode, edge_mode, face_mode = context.tool_settings.mesh_select_mode
+        if vert_mode:
+            annotation.set_vertex_indices(_selected_indices(mesh.vertices))
+        if edge_mode:
+            annotation.set_edge_indices(_selected_indices(mesh.edges))
+        if face_mode:
+            annotation.set_face_indices(_selected_indices(mesh.polygons))
 
-        # Store selected elements based on selection mode
-        if context.tool_settings.mesh_select_mode[0]:  # Vertices
-            for vert in bm.verts:
-                if vert.select:
-                    idx = annotation.vertex_indices.add()
-                    idx.value = vert.index
-
-        elif context.tool_settings.mesh_select_mode[1]:  # Edges
-            for edge in bm.edges:
-                if edge.select:
-                    idx = annotation.edge_indices.add()
-                    idx.value = edge.index
-
-        elif context.tool_settings.mesh_select_mode[2]:  # Faces
-            for face in bm.faces:
-                if face.select:
-                    idx = annotation.face_indices.add()
-                    idx.value = face.index
-
-        bmesh.update_edit_mesh(obj.data)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -118,7 +124,13 @@ class BLENDTAGGER_OT_remove_mesh_annotation(Operator):
 
     annotation_index: IntProperty(
         name="Annotation Index",
-        description="Index of the annotation to remove"
+        description="Index of the annotation to remove, used when no ID is given"
+    )
+
+    annotation_id: StringProperty(
+        name="Annotation ID",
+        description="ID of the annotation to remove",
+        options={'HIDDEN'}
     )
 
     def execute(self, context):
@@ -126,8 +138,11 @@ class BLENDTAGGER_OT_remove_mesh_annotation(Operator):
         if not obj or obj.type != 'MESH':
             return {'CANCELLED'}
 
-        if self.annotation_index >= 0 and self.annotation_index < len(obj.blendtagger.mesh_annotations):
-            obj.blendtagger.mesh_annotations.remove(self.annotation_index)
+        annotations = obj.blendtagger.mesh_annotations
+        index = find_mesh_annotation(obj, self.annotation_id) if self.annotation_id else self.annotation_index
+        if index is not None and 0 <= index < len(annotations):
+            annotations.remove(index)
+            bump_revision()
 
         return {'FINISHED'}
 
@@ -139,7 +154,13 @@ class BLENDTAGGER_OT_select_annotation(Operator):
 
     annotation_index: IntProperty(
         name="Annotation Index",
-        description="Index of the annotation to select"
+        description="Index of the annotation to select, used when no ID is given"
+    )
+
+    annotation_id: StringProperty(
+        name="Annotation ID",
+        description="ID of the annotation to select",
+        options={'HIDDEN'}
     )
 
     def execute(self, context):
@@ -147,32 +168,22 @@ class BLENDTAGGER_OT_select_annotation(Operator):
         if not obj or obj.type != 'MESH':
             return {'CANCELLED'}
 
-        # Ensure we're in edit mode
-        if obj.mode != 'EDIT':
-            bpy.ops.object.mode_set(mode='EDIT')
-
-        annotation = obj.blendtagger.mesh_annotations[self.annotation_index]
-        bm = bmesh.from_edit_mesh(obj.data)
-
-        # Deselect all first
-        for v in bm.verts: v.select = False
-        for e in bm.edges: e.select = False
-        for f in bm.faces: f.select = False
-
-        # Select based on stored indices
-        for idx in annotation.vertex_indices:
-            if idx.value < len(bm.verts):
-                bm.verts[idx.value].select = True
-
-        for idx in annotation.edge_indices:
-            if idx.value < len(bm.edges):
-                bm.edges[idx.value].select = True
-
-        for idx in annotation.face_indices:
-            if idx.value < len(bm.faces):
-                bm.faces[idx.value].select = True
+        index = find_mesh_annotation(obj, self.annotation_id) if self.annotation_id else self.annotation_index
+        if index is None:
+            return {'CANCELLED'}
+        annotation = obj.blendtagger.mesh_annotations[index]
+        vertices = annotation.get_vertex_indices()
+        edges = annotation.get_edge_indices()
+        faces = annotation.get_face_indices()
+
+        if vertices.size or edges.size or faces.size:
+            # Writes whole selection masks with foreach_set, replacing the old selection
+            AnnotationStore.select_components(obj, vertices=vertices, edges=edges, faces=faces)
+        else:
+            if obj.mode != 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='DESELECT')
 
-        bmesh.update_edit_mesh(obj.data)
         return {'FINISHED'}
 
 def register():
@@ -1,9 +1,35 @@
 import bpy
-import json
 import csv
+import json
+import math
 import os
 from bpy.props import StringProperty, EnumProperty, BoolProperty
 from bpy.types import Operator
+from ..core.data_types import INTERPOLATION_NAMES
+from ..data.export_formats import write_json_stream
+
+# JSON text templates for exported objects, filled in directly instead of building dicts
+_OBJECT_JSON = ('{{"name": {}, "type": {}, "tags": [{}], "location": [{}], '
+                '"rotation": [{}], "scale": [{}]{}}}').format
+_TAG_JSON = '{{"name": {}, "color": [{}]}}'.format
+_MESH_ANNOTATIONS_JSON = ', "mesh_annotations": [{}]'.format
+_MESH_ANNOTATION_JSON = '{{"tag": {}, "vertices": [{}], "edges": [{}], "faces": [{}]}}'.format
+_ANIMATION_TRACKS_JSON = ', "animation_tracks": [{}]'.format
+_TRACK_JSON = '{{"name": {}, "property": {}, "keyframes": [{}]}}'.format
+_KEYFRAME_JSON = '{{"frame": {}, "value": [{}], "interpolation": "{}"}}'.format
+_json_string = json.dumps
+
+def _json_numbers(values) -> str:
+    """Join numbers as the items of a JSON array, non-finite floats become null"""
+    text = ", ".join(map(repr, values))
+    if "n" in text:  # Only "nan" and "inf" spell an n, JSON has neither
+        text = ", ".join([repr(v) if math.isfinite(v) else "null" for v in values])
+    return text
+
+def _annotated_objects(scene):
+    """Get the scene objects that have at least one tag"""
+    return [obj for obj in scene.objects
+            if getattr(obj, "blendtagger", None) is not None and len(obj.blendtagger.tags)]
 
 class BLENDTAGGER_OT_export_annotations(Operator):
     """Export annotations to file"""
@@ -37,10 +63,12 @@ class BLENDTAGGER_OT_export_annotations(Operator):
 
     def gather_object_data(self, obj):
         """Gather all annotation data for an object"""
+        bt = obj.blendtagger
+        tags = bt.tags
         data = {
             "name": obj.name,
             "type": obj.type,
-            "tags": [{"name": tag.name, "color": list(tag.color)} for tag in obj.blendtagger.tags],
+            "tags": [{"name": tag.name, "color": list(tag.color)} for tag in tags] if len(tags) else [],
             "location": list(obj.location),
             "rotation": list(obj.rotation_euler),
             "scale": list(obj.scale)
@@ -49,51 +77,85 @@ class BLENDTAGGER_OT_export_annotations(Operator):
         # Add mesh annotations if enabled
         if self.include_mesh and obj.type == 'MESH':
             data["mesh_annotations"] = []
-            for ann in obj.blendtagger.mesh_annotations:
+            for ann in bt.mesh_annotations:
                 mesh_ann = {
                     "tag": ann.tag,
-                    "vertices": [idx.value for idx in ann.vertex_indices],
-                    "edges": [idx.value for idx in ann.edge_indices],
-                    "faces": [idx.value for idx in ann.face_indices]
+                    "vertices": ann.get_vertex_indices().tolist(),
+                    "edges": ann.get_edge_indices().tolist(),
+                    "faces": ann.get_face_indices().tolist()
                 }
                 data["mesh_annotations"].append(mesh_ann)
 
         # Add animation data if enabled
         if self.include_animation and obj.animation_data:
             data["animation_tracks"] = []
-            for track in obj.blendtagger.animation_tracks:
+            for track in bt.animation_tracks:
+                frames, values, interpolations = track.get_keyframes()
                 anim_track = {
                     "name": track.name,
                     "property": track.property_path,
                     "keyframes": [
                         {
-                            "frame": kf.frame,
-                            "value": list(kf.value),
-                            "interpolation": kf.interpolation
+                            "frame": frame,
+                            "value": value,
+                            "interpolation": INTERPOLATION_NAMES[interpolation]
                         }
-                        for kf in track.keyframes
+                        for frame, value, interpolation in zip(frames.tolist(),
+                                                               values.tolist(),
+                                                               interpolations.tolist())
                     ]
                 }
                 data["animation_tracks"].append(anim_track)
 
         return data
 
+    def encode_object_json(self, obj):
+        """Encode the annotation data gather_object_data collects as JSON text"""
+        bt = obj.blendtagger
+        extra = ""
+
+        if self.include_mesh and obj.type == 'MESH':
+            extra += _MESH_ANNOTATIONS_JSON(", ".join([
+                _MESH_ANNOTATION_JSON(_json_string(ann.tag),
+                                      _json_numbers(ann.get_vertex_indices().tolist()),
+                                      _json_numbers(ann.get_edge_indices().tolist()),
+                                      _json_numbers(ann.get_face_indices().tolist()))
+                for ann in bt.mesh_annotations
+            ]))
+
+        if self.include_animation and obj.animation_data:
+            tracks = []
+            for track in bt.animation_tracks:
+                frames, values, interpolations = track.get_keyframes()
+                keyframes = ", ".join([
+                    _KEYFRAME_JSON(frame, _json_numbers(value), INTERPOLATION_NAMES[interpolation])
+                    for frame, value, interpolation in zip(frames.tolist(),
+                                                           values.tolist(),
+                                                           interpolations.tolist())
+                ])
+                tracks.append(_TRACK_JSON(_json_string(track.name),
+                                          _json_string(track.property_path),
+                                          keyframes))
+            extra += _ANIMATION_TRACKS_JSON(", ".join(tracks))
+
+        return _OBJECT_JSON(
+            _json_string(obj.name),
+            _json_string(obj.type),
+            ", ".join([_TAG_JSON(_json_string(tag.name), _json_numbers(tag.color)) for tag in bt.tags]),
+            _json_numbers(obj.location),
+            _json_numbers(obj.rotation_euler),
+            _json_numbers(obj.scale),
+            extra
+        )
+
     def export_json(self, context, filepath):
         """Export annotations in JSON format"""
-        data = {
-            "scene": context.scene.name,
-            "objects": []
-        }
-
-        # Gather data for all objects with annotations
-        for obj in context.scene.objects:
-            if hasattr(obj, "blendtagger") and obj.blendtagger.tags:
-                obj_data = self.gather_object_data(obj)
-                data["objects"].append(obj_data)
+        # Encode objects with annotations one at a time, straight to JSON text
+        objects = (self.encode_object_json(obj) for obj in _annotated_objects(context.scene))
 
         # Write to file
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            write_json_stream(f, {"scene": context.scene.name}, objects)
 
     def export_csv(self, context, filepath):
         """Export annotations in CSV format"""
@@ -101,68 +163,47 @@ class BLENDTAGGER_OT_export_annotations(Operator):
             writer = csv.writer(f)
 
             # Write header
+            include_mesh = self.include_mesh
+            include_animation = self.include_animation
             header = ['object_name', 'object_type', 'tag_name', 'tag_color',
                      'location_x', 'location_y', 'location_z']
-            if self.include_mesh:
+            if include_mesh:
                 header.extend(['annotation_type', 'component_indices'])
-            if self.include_animation:
+            if include_animation:
                 header.extend(['track_name', 'property', 'keyframe_time', 'keyframe_value'])
             writer.writerow(header)
 
             # Write data rows
-            for obj in context.scene.objects:
-                if not hasattr(obj, "blendtagger") or not obj.blendtagger.tags:
-                    continue
-
-                base_row = [
-                    obj.name,
-                    obj.type,
-                ]
+            for obj in _annotated_objects(context.scene):
+                bt = obj.blendtagger
+                base_row = (obj.name, obj.type)
+                location = tuple(obj.location)
 
                 # Write tag information
-                for tag in obj.blendtagger.tags:
-                    row = base_row + [
-                        tag.name,
-                        ','.join(str(c) for c in tag.color),
-                        obj.location.x,
-                        obj.location.y,
-                        obj.location.z
-                    ]
-                    writer.writerow(row)
+                writer.writerows(
+                    (*base_row, tag.name, ','.join(map(str, tag.color)), *location)
+                    for tag in bt.tags
+                )
 
                 # Write mesh annotations if enabled
-                if self.include_mesh and obj.type == 'MESH':
-                    for ann in obj.blendtagger.mesh_annotations:
-                        if ann.vertex_indices:
-                            row = base_row + [
-                                'vertex',
-                                ','.join(str(idx.value) for idx in ann.vertex_indices)
-                            ]
-                            writer.writerow(row)
-                        if ann.edge_indices:
-                            row = base_row + [
-                                'edge',
-                                ','.join(str(idx.value) for idx in ann.edge_indices)
-                            ]
-                            writer.writerow(row)
-                        if ann.face_indices:
-                            row = base_row + [
-                                'face',
-                                ','.join(str(idx.value) for idx in ann.face_indices)
-                            ]
-                            writer.writerow(row)
+                if include_mesh and obj.type == 'MESH':
+                    writer.writerows(
+                        (*base_row, kind, ','.join(map(str, indices.tolist())))
+                        for ann in bt.mesh_annotations
+                        for kind in ('vertex', 'edge', 'face')
+                        for indices in (ann.get_indices(kind),)
+                        if len(indices)
+                    )
 
                 # Write animation data if enabled
-                if self.include_animation and obj.animation_data:
-                    for track in obj.blendtagger.animation_tracks:
-                        for kf in track.keyframes:
-                            row = base_row + [
-                                track.name,
-                                track.property_path,
-                                kf.frame,
-                                ','.join(str(v) for v in kf.value)
-                            ]
-                            writer.writerow(row)
+                if include_animation and obj.animation_data:
+                    for track in bt.animation_tracks:
+                        frames, values, _ = track.get_keyframes()
+                        name, property_path = track.name, track.property_path
+                        writer.writerows(
+                            (*base_row, name, property_path, frame, ','.join(map(str, value)))
+                            for frame, value in zip(frames.tolist(), values.tolist())
+                        )
 
     def execute(self, context):
         if not self.filepath:
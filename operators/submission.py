@@ -1,14 +1,115 @@
 import bpy
 import requests
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bpy.props import StringProperty, BoolProperty
 from bpy.types import Operator
+from .export import BLENDTAGGER_OT_export_annotations, _annotated_objects
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Network work runs off the UI thread, bpy data is only touched on the main thread
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared submission executor"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="blendtagger-submit")
+    return _executor
+
+def _shutdown_executor() -> None:
+    """Shut down the shared submission executor"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+# Payloads smaller than this are sent uncompressed
+COMPRESSION_THRESHOLD = 64 * 1024
+
+_session: Optional[requests.Session] = None
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session, keeping connections alive between requests, main thread only"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        # Only retry failed connects, a streamed body is consumed once a request is sent
+        retries = Retry(total=2, connect=2, read=0, allowed_methods=False, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retries)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+def _close_session() -> None:
+    """Close the shared HTTP session"""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+def _serialize(data: Dict[str, Any]) -> bytes:
+    """Serialize submission data to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def _content_encoding(size: int) -> Optional[str]:
+    """Get the content encoding for a request body of a given size"""
+    if size < COMPRESSION_THRESHOLD:
+        return None
+    return 'zstd' if zstandard is not None else 'gzip'
+
+def _iter_body(chunks: List[bytes], encoding: Optional[str]) -> Iterator[bytes]:
+    """Yield the request body chunk by chunk, compressing as it streams"""
+    if encoding is None:
+        yield from chunks
+        return
+
+    if encoding == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _do_submit(session: requests.Session, url: str, headers: Dict[str, str],
+               chunks: List[bytes]) -> Tuple[int, Dict[str, Any]]:
+    """POST serialized submission chunks with chunked transfer, returning status code and decoded body"""
+    encoding = _content_encoding(sum(map(len, chunks)))
+    if encoding:
+        headers = dict(headers, **{"Content-Encoding": encoding})
+    # A generator body is sent with Transfer-Encoding: chunked, never joined in memory
+    response = session.post(url, data=_iter_body(chunks, encoding), headers=headers)
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = {}
+    return response.status_code, payload
 
 class BLENDTAGGER_OT_submit_annotations(Operator):
     """Submit annotations to the BlendTagger repository"""
     bl_idname = "blendtagger.submit_annotations"
     bl_label = "Submit to Repository"
 
+    _timer = None
+
     api_key: StringProperty(
         name="API Key",
         description="Your BlendTagger API key",
@@ -45,34 +146,18 @@ class BLENDTAGGER_OT_submit_annotations(Operator):
 
     def gather_object_data(self, obj):
         """Gather annotation data for an object"""
-        from .export import BLENDTAGGER_OT_export_annotations
         exporter = BLENDTAGGER_OT_export_annotations.gather_object_data
         return exporter(self, obj)
 
-    def prepare_submission_data(self, context):
-        """Prepare complete submission package"""
-        data = {
-            "metadata": self.prepare_metadata(context),
-            "objects": []
-        }
-
-        # Gather data for all annotated objects
-        for obj in context.scene.objects:
-            if hasattr(obj, "blendtagger") and obj.blendtagger.tags:
-                obj_data = self.gather_object_data(obj)
-                data["objects"].append(obj_data)
-
-        return data
-
-    def validate_submission(self, data):
-        """Validate submission data before sending"""
-        if not data["objects"]:
-            return False, "No annotated objects found"
-
-        for obj in data["objects"]:
-            if not obj.get("tags"):
-                return False, f"Object {obj['name']} has no tags"
+    def iter_object_data(self, context):
+        """Gather annotation data for each annotated object in turn"""
+        for obj in _annotated_objects(context.scene):
+            yield self.gather_object_data(obj)
 
+    def validate_object(self, obj_data):
+        """Validate one object's submission data"""
+        if not obj_data.get("tags"):
+            return False, f"Object {obj_data['name']} has no tags"
         return True, ""
 
     def execute(self, context):
@@ -80,37 +165,62 @@ class BLENDTAGGER_OT_submit_annotations(Operator):
             self.report({'ERROR'}, "API key is required")
             return {'CANCELLED'}
 
-        # Prepare submission data
-        submission_data = self.prepare_submission_data(context)
+        # Serialize one object at a time on the main thread, the worker only does network IO.
+        # Only the encoded chunks are kept, never the whole package as dicts or one string
+        chunks = [b'{"metadata":', _serialize(self.prepare_metadata(context)), b',"objects":[']
+        count = 0
+        for obj_data in self.iter_object_data(context):
+            # Validate before submission
+            valid, message = self.validate_object(obj_data)
+            if not valid:
+                self.report({'ERROR'}, f"Validation failed: {message}")
+                return {'CANCELLED'}
 
-        # Validate before submission
-        valid, message = self.validate_submission(submission_data)
-        if not valid:
-            self.report({'ERROR'}, f"Validation failed: {message}")
+            if count:
+                chunks.append(b',')
+            chunks.append(_serialize(obj_data))
+            count += 1
+        chunks.append(b']}')
+
+        if not count:
+            self.report({'ERROR'}, "Validation failed: No annotated objects found")
             return {'CANCELLED'}
 
-        try:
-            # Submit to repository
-            response = requests.post(
-                self.repository_url,
-                json=submission_data,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "User-Agent": f"BlendTagger/{context.preferences.addons[__package__].bl_info.get('version', (0, 0, 0))}"
-                }
-            )
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": f"BlendTagger/{context.preferences.addons[__package__].bl_info.get('version', (0, 0, 0))}"
+        }
+        # The session is created here so concurrent workers never race to create it
+        self._future = _get_executor().submit(_do_submit, _get_session(), self.repository_url,
+                                              headers, chunks)
 
-            # Handle response
-            if response.status_code == 201:
-                submission_id = response.json().get('submission_id')
-                self.report({'INFO'}, f"Successfully submitted annotations (ID: {submission_id})")
-                return {'FINISHED'}
-            else:
-                error_msg = response.json().get('error', 'Unknown error occurred')
-                self.report({'ERROR'}, f"Submission failed: {error_msg}")
-                return {'CANCELLED'}
+        # Without a window (background mode, scripted calls) there is no event loop to poll from
+        if context.window is None:
+            return self.report_result()
+
+        # Poll the request from a timer so the UI stays responsive
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or not self._future.done():
+            return {'PASS_THROUGH'}
+
+        self.cancel(context)
+        return self.report_result()
 
+    def cancel(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+    def report_result(self):
+        """Wait for the submitted request and report its outcome"""
+        try:
+            status_code, payload = self._future.result()
         except requests.exceptions.RequestException as e:
             self.report({'ERROR'}, f"Connection error: {str(e)}")
             return {'CANCELLED'}
@@ -118,6 +228,16 @@ class BLENDTAGGER_OT_submit_annotations(Operator):
             self.report({'ERROR'}, f"Unexpected error: {str(e)}")
             return {'CANCELLED'}
 
+        # Handle response
+        if status_code == 201:
+            submission_id = payload.get('submission_id')
+            self.report({'INFO'}, f"Successfully submitted annotations (ID: {submission_id})")
+            return {'FINISHED'}
+        else:
+            error_msg = payload.get('error', 'Unknown error occurred')
+            self.report({'ERROR'}, f"Submission failed: {error_msg}")
+            return {'CANCELLED'}
+
     def invoke(self, context, event):
         # Load API key from preferences if available
         addon_prefs = context.preferences.addons[__package__].preferences
@@ -145,7 +265,7 @@ class BLENDTAGGER_OT_check_submission_status(Operator):
             return {'CANCELLED'}
 
         try:
-            response = requests.get(
+            response = _get_session().get(
                 f"https://api.blendtagger.com/v1/submissions/{self.submission_id}",
                 headers={"Authorization": f"Bearer {api_key}"}
             )
@@ -172,3 +292,5 @@ def register():
 def unregister():
     bpy.utils.unregister_class(BLENDTAGGER_OT_check_submission_status)
     bpy.utils.unregister_class(BLENDTAGGER_OT_submit_annotations)
+    _shutdown_executor()
+    _close_session()
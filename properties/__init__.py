@@ -0,0 +1,13 @@
+from . import scene_props
+
+modules = [
+    scene_props
+]
+
+def register():
+    for module in modules:
+        module.register()
+
+def unregister():
+    for module in reversed(modules):
+        module.unregister()
@@ -0,0 +1,87 @@
+import bpy
+from bpy.app.handlers import persistent
+from bpy.props import BoolProperty, IntProperty, FloatProperty, PointerProperty
+from bpy.types import PropertyGroup
+
+# Bumped whenever tags, annotations or tracks may have changed, panels and stores key cached
+# data on it. Kept outside ID data so undo never rolls it back to a value already handed out
+_revision = 0
+
+def bump_revision() -> None:
+    """Mark tags, annotations or animation tracks as changed"""
+    global _revision
+    _revision += 1
+
+def get_revision() -> int:
+    """Get the current annotation revision"""
+    return _revision
+
+@persistent
+def _bump_revision_handler(*_) -> None:
+    """Undo, redo and file loads replace annotation data without going through the stores"""
+    bump_revision()
+
+_REVISION_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+class BlendTaggerMotionMetrics(PropertyGroup):
+    """Motion analysis results shown in the animation analysis panel"""
+    avg_velocity: FloatProperty(name="Average Velocity")
+    peak_velocity: FloatProperty(name="Peak Velocity")
+    complexity: FloatProperty(name="Motion Complexity")
+
+def register():
+    bpy.utils.register_class(BlendTaggerMotionMetrics)
+
+    for name in _REVISION_HANDLERS:
+        getattr(bpy.app.handlers, name).append(_bump_revision_handler)
+
+    # Animation capture properties
+    bpy.types.Scene.blendtagger_capture_location = BoolProperty(
+        name="Capture Location",
+        default=True
+    )
+    bpy.types.Scene.blendtagger_capture_rotation = BoolProperty(
+        name="Capture Rotation",
+        default=True
+    )
+    bpy.types.Scene.blendtagger_capture_scale = BoolProperty(
+        name="Capture Scale",
+        default=True
+    )
+    bpy.types.Scene.blendtagger_start_frame = IntProperty(
+        name="Start Frame",
+        default=1
+    )
+    bpy.types.Scene.blendtagger_end_frame = IntProperty(
+        name="End Frame",
+        default=250
+    )
+    bpy.types.Scene.blendtagger_show_keyframes = BoolProperty(
+        name="Show Keyframe Details",
+        default=False
+    )
+
+    # Analysis properties
+    bpy.types.Scene.blendtagger_motion_metrics = PointerProperty(
+        type=BlendTaggerMotionMetrics
+    )
+    bpy.types.Scene.blendtagger_motion_preview = PointerProperty(
+        type=bpy.types.ImagePreview
+    )
+
+def unregister():
+    del bpy.types.Scene.blendtagger_motion_preview
+    del bpy.types.Scene.blendtagger_motion_metrics
+    del bpy.types.Scene.blendtagger_show_keyframes
+    del bpy.types.Scene.blendtagger_end_frame
+    del bpy.types.Scene.blendtagger_start_frame
+    del bpy.types.Scene.blendtagger_capture_scale
+    del bpy.types.Scene.blendtagger_capture_rotation
+    del bpy.types.Scene.blendtagger_capture_location
+
+    for name in _REVISION_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _bump_revision_handler in handlers:
+            handlers.remove(_bump_revision_handler)
+
+    bpy.utils.unregister_class(BlendTaggerMotionMetrics)
@@ -0,0 +1,60 @@
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _install_blender_modules():
+    """Provide the bpy, bmesh and mathutils names the add-on imports when run outside Blender"""
+    try:
+        import bpy  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    bpy = types.ModuleType("bpy")
+    props = types.ModuleType("bpy.props")
+    for name in ("BoolProperty", "CollectionProperty", "EnumProperty", "FloatProperty",
+                 "FloatVectorProperty", "IntProperty", "PointerProperty", "StringProperty"):
+        setattr(props, name, lambda *args, **kwargs: None)
+    bpy_types = types.ModuleType("bpy.types")
+    for name in ("Context", "Event", "ImagePreview", "Mesh", "Object", "Operator", "Panel",
+                 "PropertyGroup", "Scene", "UILayout", "UIList", "bpy_prop_collection"):
+        setattr(bpy_types, name, type(name, (), {}))
+    bpy.props = props
+    bpy.types = bpy_types
+    bpy.context = types.SimpleNamespace(scene=None)
+    bpy.utils = types.SimpleNamespace(register_class=lambda cls: None,
+                                      unregister_class=lambda cls: None,
+                                      register_classes_factory=lambda classes: (lambda: None, lambda: None))
+    app = types.ModuleType("bpy.app")
+    handlers = types.ModuleType("bpy.app.handlers")
+    handlers.load_post = []
+    handlers.undo_post = []
+    handlers.redo_post = []
+    handlers.persistent = lambda func: func
+    app.version_string = ""
+    app.handlers = handlers
+    bpy.app = app
+    bpy.data = types.SimpleNamespace(objects=[])
+
+    bmesh = types.ModuleType("bmesh")
+    bmesh.types = types.SimpleNamespace(BMesh=object)
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = tuple
+    mathutils.Matrix = None
+
+    sys.modules.update({"bpy": bpy, "bpy.props": props, "bpy.types": bpy_types,
+                        "bpy.app": app, "bpy.app.handlers": handlers,
+                        "bmesh": bmesh, "mathutils": mathutils})
+
+def _install_package():
+    """Make the add-on importable as the blendtagger package without running its register imports"""
+    if "blendtagger" in sys.modules:
+        return
+    package = types.ModuleType("blendtagger")
+    package.__path__ = [str(ROOT)]
+    sys.modules["blendtagger"] = package
+
+_install_blender_modules()
+_install_package()
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from blendtagger.core.data_types import AnimationTrack
+from blendtagger.data import animation_store
+from blendtagger.data.animation_store import AnimationStore
+
+class FakeCollection:
+    """Keyframe collection supporting the bulk access AnimationTrack uses"""
+
+    def __init__(self, n=0):
+        self.arrays = {"frame": np.zeros(n), "value": np.zeros(n * 3), "interpolation": np.zeros(n)}
+
+    def __len__(self):
+        return len(self.arrays["frame"])
+
+    def _resize(self, n):
+        self.arrays = {"frame": np.resize(self.arrays["frame"], n),
+                       "value": np.resize(self.arrays["value"], n * 3),
+                       "interpolation": np.resize(self.arrays["interpolation"], n)}
+
+    def add(self):
+        self._resize(len(self) + 1)
+
+    def remove(self, i):
+        assert i == len(self) - 1
+        self._resize(i)
+
+    def clear(self):
+        self._resize(0)
+
+    def foreach_get(self, name, buf):
+        buf[...] = self.arrays[name].astype(buf.dtype)
+
+    def foreach_set(self, name, buf):
+        self.arrays[name] = np.array(buf, dtype=np.float64)
+
+class FakeTracks(list):
+    def __len__(self):
+        return list.__len__(self)
+
+def make_object(frames, values):
+    track = AnimationTrack()
+    track.name = "location[0]"
+    track.keyframes = FakeCollection()
+    track.set_keyframes(np.asarray(frames), np.asarray(values), np.full(len(frames), 1))
+
+    class Blendtagger:
+        animation_tracks = FakeTracks([track])
+
+    class Obj:
+        session_uid = id(track)
+        blendtagger = Blendtagger()
+
+    return Obj(), track
+
+@pytest.fixture
+def without_numba(monkeypatch):
+    monkeypatch.setattr(animation_store, "_HAS_NUMBA", False)
+
+def test_optimize_keyframes_without_numba_drops_collinear_keys(without_numba):
+    obj, track = make_object([1, 2, 3, 4, 5], [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    assert AnimationStore.optimize_keyframes(obj, tolerance=0.001) == 3
+    frames, values, _ = track.get_keyframes()
+    assert frames.tolist() == [1, 5]
+    assert values[:, 0].tolist() == [0.0, 4.0]
+
+def test_optimize_keyframes_without_numba_keeps_peaks(without_numba):
+    obj, track = make_object([1, 2, 3, 4, 5], [0.0, 0.0, 5.0, 0.0, 0.0])
+
+    assert AnimationStore.optimize_keyframes(obj, tolerance=0.001) == 0
+    frames, _, _ = track.get_keyframes()
+    assert frames.tolist() == [1, 2, 3, 4, 5]
+
+def test_cached_arrays_reread_after_revision_bump():
+    obj, track = make_object([1, 2, 3], [0.0, 1.0, 2.0])
+    assert animation_store._get_arrays(obj, track)[0].tolist() == [1, 2, 3]
+
+    # Same keyframe count, as after undoing a recapture
+    track.keyframes.arrays["frame"] = np.array([4.0, 5.0, 6.0])
+    animation_store.bump_revision()
+
+    assert animation_store._get_arrays(obj, track)[0].tolist() == [4, 5, 6]
@@ -0,0 +1,37 @@
+import types
+
+import bpy
+
+from blendtagger.core import data_types
+
+class FakeKeyframe(dict):
+    """Keyframe whose stored ID properties are the dict items"""
+    interpolation = 'BEZIER'
+
+def make_scene(stored):
+    keyframes = []
+    for value in stored:
+        keyframe = FakeKeyframe()
+        if value is not None:
+            keyframe["interpolation"] = value
+        keyframes.append(keyframe)
+    track = types.SimpleNamespace(keyframes=keyframes)
+    obj = types.SimpleNamespace(blendtagger=types.SimpleNamespace(animation_tracks=[track]))
+    return [obj], keyframes
+
+def test_migrate_interpolations_converts_names(monkeypatch):
+    objects, keyframes = make_scene(['LINEAR', 'CONSTANT', 'UNKNOWN'])
+    monkeypatch.setattr(bpy, "data", types.SimpleNamespace(objects=objects))
+
+    data_types._migrate_interpolations()
+
+    assert [kf.interpolation for kf in keyframes] == ['LINEAR', 'CONSTANT', 'BEZIER']
+    assert not any("interpolation" in kf for kf in keyframes)
+
+def test_migrate_interpolations_skips_enum_tracks(monkeypatch):
+    objects, keyframes = make_scene([1, 1])
+    monkeypatch.setattr(bpy, "data", types.SimpleNamespace(objects=objects))
+
+    data_types._migrate_interpolations()
+
+    assert [kf["interpolation"] for kf in keyframes] == [1, 1]
@@ -0,0 +1,42 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from blendtagger.operators.export import BLENDTAGGER_OT_export_annotations, _json_numbers
+
+def test_json_numbers_round_trip():
+    values = [0.1, -2.5, 1e-07, 3]
+    assert json.loads(f"[{_json_numbers(values)}]") == values
+
+def test_json_numbers_non_finite_become_null():
+    text = _json_numbers([1.0, float("nan"), float("inf"), -float("inf")])
+    assert json.loads(f"[{text}]") == [1.0, None, None, None]
+
+def make_object():
+    tag = SimpleNamespace(name='Chair "A"', color=(0.25, 0.5, 1.0))
+    annotation = SimpleNamespace(tag="seat",
+                                 get_vertex_indices=lambda: np.array([0, 2, 5], dtype=np.int32),
+                                 get_edge_indices=lambda: np.array([], dtype=np.int32),
+                                 get_face_indices=lambda: np.array([1], dtype=np.int32))
+    track = SimpleNamespace(name="location", property_path="location",
+                            get_keyframes=lambda: (np.array([1, 10], dtype=np.int32),
+                                                   np.array([[0.0, 1.5, 2.0], [0.1, float("nan"), 3.0]],
+                                                            dtype=np.float32),
+                                                   np.array([0, 1], dtype=np.int32)))
+    bt = SimpleNamespace(tags=[tag], mesh_annotations=[annotation], animation_tracks=[track])
+    return SimpleNamespace(name="Chair", type='MESH', blendtagger=bt, animation_data=object(),
+                           location=(1.0, 2.0, 3.0), rotation_euler=(0.0, 0.5, 0.0), scale=(1.0, 1.0, 1.0))
+
+@pytest.mark.parametrize("include_mesh, include_animation",
+                         [(True, True), (True, False), (False, True), (False, False)])
+def test_encode_object_json_matches_gather_object_data(include_mesh, include_animation):
+    operator = SimpleNamespace(include_mesh=include_mesh, include_animation=include_animation)
+    obj = make_object()
+
+    gathered = BLENDTAGGER_OT_export_annotations.gather_object_data(operator, obj)
+    # NaN never compares equal, the encoder writes it as null
+    gathered = json.loads(json.dumps(gathered).replace("NaN", "null"))
+
+    assert json.loads(BLENDTAGGER_OT_export_annotations.encode_object_json(operator, obj)) == gathered
@@ -0,0 +1,12 @@
+from blendtagger.properties import scene_props
+
+def test_revision_only_increases():
+    start = scene_props.get_revision()
+    scene_props.bump_revision()
+    scene_props.bump_revision()
+    assert scene_props.get_revision() == start + 2
+
+def test_undo_handler_moves_past_every_handed_out_revision():
+    seen = scene_props.get_revision()
+    scene_props._bump_revision_handler(None, None)
+    assert scene_props.get_revision() > seen
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from blendtagger.core import utils
+
+class FakeElements:
+    """Mesh element collection supporting bulk reads"""
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = np.asarray(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def foreach_get(self, name, buf):
+        assert name == self.name
+        buf[...] = self.rows.ravel()
+
+def test_component_center_accepts_index_arrays():
+    mesh = SimpleNamespace(vertices=FakeElements("co", [[0, 0, 0], [2, 0, 0], [0, 4, 0]]),
+                           edges=FakeElements("vertices", [[0, 1]]),
+                           polygons=FakeElements("center", [[1, 1, 1]]))
+    obj = SimpleNamespace(type='MESH', data=mesh)
+
+    center = utils.get_component_center(obj, np.array([2], dtype=np.int32),
+                                        np.array([0], dtype=np.int32), np.array([], dtype=np.int32))
+
+    assert np.allclose(center, [0.5, 2.0, 0.0])
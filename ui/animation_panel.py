@@ -1,5 +1,12 @@
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, UIList
+from ..core.utils import draw_section
+
+class BLENDTAGGER_UL_keyframes(UIList):
+    """Keyframe list, only rows in view are drawn"""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.label(text=f"F:{item.frame} V:{item.value[0]:.3f} {item.interpolation}")
 
 class BLENDTAGGER_PT_animation_panel(Panel):
     bl_label = "Animation Data"
@@ -23,36 +30,33 @@ class BLENDTAGGER_PT_animation_panel(Panel):
             return
 
         # Animation capture settings
-        box = layout.box()
-        box.label(text="Capture Settings")
+        box = draw_section(layout, "Capture Settings")
         col = box.column()
         col.prop(context.scene, "blendtagger_capture_location", text="Location")
         col.prop(context.scene, "blendtagger_capture_rotation", text="Rotation")
         col.prop(context.scene, "blendtagger_capture_scale", text="Scale")
 
         # Animation range
-        box = layout.box()
-        box.label(text="Frame Range")
+        box = draw_section(layout, "Frame Range")
         col = box.column(align=True)
         row = col.row(align=True)
         row.prop(context.scene, "blendtagger_start_frame", text="Start")
         row.prop(context.scene, "blendtagger_end_frame", text="End")
 
         # Capture controls
-        box = layout.box()
-        box.label(text="Capture Controls")
+        box = draw_section(layout, "Capture Controls")
         col = box.column(align=True)
         row = col.row(align=True)
         row.operator("blendtagger.capture_animation", text="Capture Animation")
         row.operator("blendtagger.clear_animation", text="Clear")
 
         # Display captured data
-        if hasattr(obj, "blendtagger") and obj.blendtagger.animation_tracks:
-            box = layout.box()
-            box.label(text="Captured Animation Data")
+        bt = obj.blendtagger
+        if len(bt.animation_tracks):
+            box = draw_section(layout, "Captured Animation Data")
 
             # Track list
-            for track in obj.blendtagger.animation_tracks:
+            for track in bt.animation_tracks:
                 box = layout.box()
                 row = box.row()
                 row.label(text=f"Track: {track.name}")
@@ -65,12 +69,9 @@ class BLENDTAGGER_PT_animation_panel(Panel):
 
                 # Expand/collapse keyframe details
                 if context.scene.blendtagger_show_keyframes:
-                    sub_box = box.box()
-                    for keyframe in track.keyframes:
-                        row = sub_box.row()
-                        row.label(text=f"Frame: {keyframe.frame}")
-                        row.label(text=f"Value: {keyframe.value[0]:.3f}")
-                        row.label(text=f"Type: {keyframe.interpolation}")
+                    box.template_list("BLENDTAGGER_UL_keyframes", track.name,
+                                      track, "keyframes", track, "active_keyframe_index",
+                                      rows=5)
 
 class BLENDTAGGER_PT_animation_analysis_panel(Panel):
     bl_label = "Animation Analysis"
@@ -85,83 +86,34 @@ class BLENDTAGGER_PT_animation_analysis_panel(Panel):
         obj = context.active_object
         return (context.scene.blendtagger_mode == 'ANIMATION' and
                 obj is not None and
-                hasattr(obj, "blendtagger") and
                 len(obj.blendtagger.animation_tracks) > 0)
 
     def draw(self, context):
         layout = self.layout
 
         # Analysis tools
-        box = layout.box()
-        box.label(text="Analysis Tools")
+        box = draw_section(layout, "Analysis Tools")
 
         col = box.column(align=True)
         col.operator("blendtagger.analyze_motion", text="Analyze Motion")
         col.operator("blendtagger.detect_keyframe_patterns", text="Detect Patterns")
 
         # Motion metrics
-        if context.scene.blendtagger_motion_metrics:
-            box = layout.box()
-            box.label(text="Motion Metrics")
-            col = box.column()
-
-            metrics = context.scene.blendtagger_motion_metrics
-            col.label(text=f"Average Velocity: {metrics.avg_velocity:.2f}")
-            col.label(text=f"Peak Velocity: {metrics.peak_velocity:.2f}")
-            col.label(text=f"Motion Complexity: {metrics.complexity:.2f}")
+        metrics = context.scene.blendtagger_motion_metrics
+        if metrics:
+            box = draw_section(layout, "Motion Metrics")
+            label = box.column().label
+            label(text=f"Average Velocity: {metrics.avg_velocity:.2f}")
+            label(text=f"Peak Velocity: {metrics.peak_velocity:.2f}")
+            label(text=f"Motion Complexity: {metrics.complexity:.2f}")
 
             # Motion graphs
-            box = layout.box()
-            box.label(text="Motion Graphs")
+            box = draw_section(layout, "Motion Graphs")
             box.template_preview(context.scene.blendtagger_motion_preview)
 
-def register():
-    bpy.utils.register_class(BLENDTAGGER_PT_animation_panel)
-    bpy.utils.register_class(BLENDTAGGER_PT_animation_analysis_panel)
-
-    # Register properties
-    bpy.types.Scene.blendtagger_capture_location = bpy.props.BoolProperty(
-        name="Capture Location",
-        default=True
-    )
-    bpy.types.Scene.blendtagger_capture_rotation = bpy.props.BoolProperty(
-        name="Capture Rotation",
-        default=True
-    )
-    bpy.types.Scene.blendtagger_capture_scale = bpy.props.BoolProperty(
-        name="Capture Scale",
-        default=True
-    )
-    bpy.types.Scene.blendtagger_start_frame = bpy.props.IntProperty(
-        name="Start Frame",
-        default=1
-    )
-    bpy.types.Scene.blendtagger_end_frame = bpy.props.IntProperty(
-        name="End Frame",
-        default=250
-    )
-    bpy.types.Scene.blendtagger_show_keyframes = bpy.props.BoolProperty(
-        name="Show Keyframe Details",
-        default=False
-    )
-
-    # Analysis properties
-    bpy.types.Scene.blendtagger_motion_metrics = bpy.props.PointerProperty(
-        type=bpy.types.PropertyGroup
-    )
-    bpy.types.Scene.blendtagger_motion_preview = bpy.props.PointerProperty(
-        type=bpy.types.ImagePreview
-    )
-
-def unregister():
-    del bpy.types.Scene.blendtagger_motion_preview
-    del bpy.types.Scene.blendtagger_motion_metrics
-    del bpy.types.Scene.blendtagger_show_keyframes
-    del bpy.types.Scene.blendtagger_end_frame
-    del bpy.types.Scene.blendtagger_start_frame
-    del bpy.types.Scene.blendtagger_capture_scale
-    del bpy.types.Scene.blendtagger_capture_rotation
-    del bpy.types.Scene.blendtagger_capture_location
-
-    bpy.utils.unregister_class(BLENDTAGGER_PT_animation_analysis_panel)
-    bpy.utils.unregister_class(BLENDTAGGER_PT_animation_panel)
+_classes = (
+    BLENDTAGGER_UL_keyframes,
+    BLENDTAGGER_PT_animation_panel,
+    BLENDTAGGER_PT_animation_analysis_panel,
+)
+register, unregister = bpy.utils.register_classes_factory(_classes)
@@ -1,5 +1,31 @@
 import bpy
+from typing import Dict, Tuple
+from bpy.props import BoolProperty, FloatProperty, EnumProperty
 from bpy.types import Panel
+from ..core.utils import draw_section
+from ..properties.scene_props import get_revision
+
+# Enum items are kept alive at module scope for as long as the property is registered
+_DISPLAY_MODE_ITEMS = (
+    ('OVERLAY', "Overlay", "Show annotations as overlay"),
+    ('SOLID', "Solid", "Show annotations as solid colors"),
+    ('WIREFRAME', "Wireframe", "Show annotations in wireframe mode"),
+)
+
+# Object session_uid -> (revision, count) and the annotation tags and ids drawn for it
+_ANNOTATION_ROWS: Dict[int, Tuple[Tuple[int, int], Tuple[Tuple[str, str], ...]]] = {}
+
+def _annotation_rows(obj: bpy.types.Object, revision: int) -> Tuple[Tuple[str, str], ...]:
+    """Get the tag and id of each of an object's mesh annotations, reread only after a revision bump"""
+    annotations = obj.blendtagger.mesh_annotations
+    key = (revision, len(annotations))
+    cached = _ANNOTATION_ROWS.get(obj.session_uid)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    rows = tuple([(annotation.tag, annotation.id) for annotation in annotations])
+    _ANNOTATION_ROWS[obj.session_uid] = (key, rows)
+    return rows
 
 class BLENDTAGGER_PT_annotation_panel(Panel):
     bl_label = "Annotations"
@@ -26,25 +52,22 @@ class BLENDTAGGER_PT_annotation_panel(Panel):
 
     def draw_object_tags(self, context, layout, obj):
         # Tag list
-        box = layout.box()
-        box.label(text="Object Tags")
+        box = draw_section(layout, "Object Tags")
 
         # Add tag button
         row = box.row()
         row.operator("blendtagger.add_tag", text="Add Tag")
 
         # Existing tags
-        if hasattr(obj, "blendtagger"):
-            for tag in obj.blendtagger.tags:
-                row = box.row(align=True)
-                row.prop(tag, "name", text="")
-                row.prop(tag, "color", text="")
-                op = row.operator("blendtagger.remove_tag", text="", icon='X')
-                op.tag_name = tag.name
+        for idx, tag in enumerate(obj.blendtagger.tags):
+            row = box.row(align=True)
+            row.prop(tag, "name", text="")
+            row.prop(tag, "color", text="")
+            op = row.operator("blendtagger.remove_tag", text="", icon='X')
+            op.tag_index = idx
 
         # Tag presets
-        box = layout.box()
-        box.label(text="Tag Presets")
+        box = draw_section(layout, "Tag Presets")
         row = box.row()
         row.template_list("BLENDTAGGER_UL_tag_presets", "",
                          context.scene, "blendtagger_tag_presets",
@@ -59,29 +82,31 @@ class BLENDTAGGER_PT_annotation_panel(Panel):
             return
 
         # Component selection mode
-        box = layout.box()
-        box.label(text="Selection Mode")
+        box = draw_section(layout, "Selection Mode")
         row = box.row(align=True)
         row.prop(context.tool_settings, "mesh_select_mode", text="")
 
         # Annotation tools
-        box = layout.box()
-        box.label(text="Annotation Tools")
+        box = draw_section(layout, "Annotation Tools")
         col = box.column(align=True)
         col.operator("blendtagger.add_mesh_annotation", text="Add Annotation")
         col.operator("blendtagger.remove_mesh_annotation", text="Remove Annotation")
 
         # Existing annotations
-        box = layout.box()
-        box.label(text="Current Annotations")
-        if hasattr(obj, "blendtagger"):
-            for annotation in obj.blendtagger.mesh_annotations:
-                row = box.row(align=True)
-                row.label(text=annotation.tag)
-                op = row.operator("blendtagger.select_annotation", text="Select")
-                op.annotation_index = obj.blendtagger.mesh_annotations.find(annotation)
-                op = row.operator("blendtagger.remove_mesh_annotation", text="", icon='X')
-                op.annotation_index = obj.blendtagger.mesh_annotations.find(annotation)
+        box = draw_section(layout, "Current Annotations")
+        # Rows come from the revision keyed snapshot and only touch plain strings.
+        # Annotations are addressed by id, older ones without an id by index
+        rows = _annotation_rows(obj, get_revision())
+        new_row = box.row
+        for idx, (tag, annotation_id) in enumerate(rows):
+            row = new_row(align=True)
+            row.label(text=tag)
+            for op in (row.operator("blendtagger.select_annotation", text="Select"),
+                       row.operator("blendtagger.remove_mesh_annotation", text="", icon='X')):
+                if annotation_id:
+                    op.annotation_id = annotation_id
+                else:
+                    op.annotation_index = idx
 
 class BLENDTAGGER_PT_visualization_panel(Panel):
     bl_label = "Visualization"
@@ -99,49 +124,57 @@ class BLENDTAGGER_PT_visualization_panel(Panel):
 
     def draw(self, context):
         layout = self.layout
+        layout.use_property_split = True
+        scene = context.scene
 
         # Visualization settings
-        box = layout.box()
-        box.label(text="Display Settings")
+        box = draw_section(layout, "Display Settings")
         col = box.column()
-        col.prop(context.scene, "blendtagger_show_annotations", text="Show Annotations")
-        col.prop(context.scene, "blendtagger_annotation_opacity", text="Opacity")
-
-        # Display modes
-        box = layout.box()
-        box.label(text="Display Mode")
-        row = box.row()
-        row.prop(context.scene, "blendtagger_display_mode", expand=True)
-
-def register():
-    bpy.utils.register_class(BLENDTAGGER_PT_annotation_panel)
-    bpy.utils.register_class(BLENDTAGGER_PT_visualization_panel)
-
-    # Register properties
-    bpy.types.Scene.blendtagger_show_annotations = bpy.props.BoolProperty(
+        col.use_property_decorate = False  # No animate buttons, these are view settings
+        col.prop(scene, "blendtagger_show_annotations", text="Show Annotations")
+        col.prop(scene, "blendtagger_annotation_opacity", text="Opacity")
+
+        # Display modes only matter while annotations are shown
+        if scene.blendtagger_show_annotations:
+            box = draw_section(layout, "Display Mode")
+            row = box.row()
+            row.prop(scene, "blendtagger_display_mode", expand=True)
+
+_classes = (
+    BLENDTAGGER_PT_annotation_panel,
+    BLENDTAGGER_PT_visualization_panel,
+)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
+# Scene properties, set in order on register and removed in reverse
+_PROPS = (
+    ("blendtagger_show_annotations", BoolProperty(
         name="Show Annotations",
         default=True
-    )
-    bpy.types.Scene.blendtagger_annotation_opacity = bpy.props.FloatProperty(
+    )),
+    ("blendtagger_annotation_opacity", FloatProperty(
         name="Annotation Opacity",
         default=0.5,
         min=0.0,
         max=1.0
-    )
-    bpy.types.Scene.blendtagger_display_mode = bpy.props.EnumProperty(
-        items=[
-            ('OVERLAY', "Overlay", "Show annotations as overlay"),
-            ('SOLID', "Solid", "Show annotations as solid colors"),
-            ('WIREFRAME', "Wireframe", "Show annotations in wireframe mode"),
-        ],
+    )),
+    ("blendtagger_display_mode", EnumProperty(
+        items=_DISPLAY_MODE_ITEMS,
         default='OVERLAY',
         name="Display Mode"
-    )
+    )),
+)
+
+def register():
+    _register_classes()
+
+    # Register properties
+    for name, prop in _PROPS:
+        setattr(bpy.types.Scene, name, prop)
 
 def unregister():
-    del bpy.types.Scene.blendtagger_display_mode
-    del bpy.types.Scene.blendtagger_annotation_opacity
-    del bpy.types.Scene.blendtagger_show_annotations
+    _ANNOTATION_ROWS.clear()
+    for name, _ in reversed(_PROPS):
+        delattr(bpy.types.Scene, name)
 
-    bpy.utils.unregister_class(BLENDTAGGER_PT_visualization_panel)
-    bpy.utils.unregister_class(BLENDTAGGER_PT_annotation_panel)
+    _unregister_classes()
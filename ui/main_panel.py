@@ -1,5 +1,46 @@
 import bpy
+from typing import Dict, Tuple
+from bpy.props import EnumProperty, StringProperty
 from bpy.types import Panel
+from ..core.utils import draw_section
+from ..properties.scene_props import get_revision
+
+# Enum items are kept alive at module scope for as long as the property is registered
+_MODE_ITEMS = (
+    ('OBJECT', "Object", "Object-level annotation mode"),
+    ('MESH', "Mesh", "Mesh component annotation mode"),
+    ('ANIMATION', "Animation", "Animation data annotation mode"),
+)
+
+# Quick stats labels
+_ACTIVE_LABEL = "Active: {}".format
+_TAGS_LABEL = "Tags: {}".format
+_ANNOTATIONS_LABEL = "Annotations: {}".format
+_TRACKS_LABEL = "Animation Tracks: {}".format
+
+# Object session_uid -> key and the quick stats labels formatted for it
+_STATS_LABELS: Dict[int, Tuple[Tuple, Tuple[str, ...]]] = {}
+
+def _stats_labels(obj: bpy.types.Object, revision: int) -> Tuple[str, ...]:
+    """Get the active name label and count labels, reformatted only after a change"""
+    is_mesh = obj.type == 'MESH'
+    has_animation = obj.animation_data is not None
+    # Every object has blendtagger while the panels are registered
+    bt = obj.blendtagger
+    counts = (len(bt.tags), len(bt.mesh_annotations), len(bt.animation_tracks))
+    key = (revision, obj.name, is_mesh, has_animation, counts)
+    cached = _STATS_LABELS.get(obj.session_uid)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    labels = [_ACTIVE_LABEL(obj.name), _TAGS_LABEL(counts[0])]
+    if is_mesh:
+        labels.append(_ANNOTATIONS_LABEL(counts[1]))
+    if has_animation:
+        labels.append(_TRACKS_LABEL(counts[2]))
+    labels = tuple(labels)
+    _STATS_LABELS[obj.session_uid] = (key, labels)
+    return labels
 
 class BLENDTAGGER_PT_main_panel(Panel):
     bl_label = "BlendTagger"
@@ -17,20 +58,15 @@ class BLENDTAGGER_PT_main_panel(Panel):
             return
 
         # Quick stats
+        active_label, *count_labels = _stats_labels(obj, get_revision())
         box = layout.box()
-        row = box.row()
-        row.label(text=f"Active: {obj.name}")
-        row = box.row()
-        if hasattr(obj, "blendtagger"):
-            row.label(text=f"Tags: {len(obj.blendtagger.tags)}")
-            if obj.type == 'MESH':
-                row.label(text=f"Annotations: {len(obj.blendtagger.mesh_annotations)}")
-            if obj.animation_data:
-                row.label(text=f"Animation Tracks: {len(obj.blendtagger.animation_tracks)}")
+        box.row().label(text=active_label)
+        label = box.row().label
+        for text in count_labels:
+            label(text=text)
 
         # Mode selection
-        box = layout.box()
-        box.label(text="Annotation Mode")
+        box = draw_section(layout, "Annotation Mode")
         row = box.row()
         row.prop(context.scene, "blendtagger_mode", expand=True)
 
@@ -46,54 +82,67 @@ class BLENDTAGGER_PT_tools_panel(Panel):
         layout = self.layout
 
         # Export tools
-        box = layout.box()
-        box.label(text="Export")
+        box = draw_section(layout, "Export")
         col = box.column(align=True)
         col.operator("blendtagger.export_annotations", text="Export JSON").format = 'JSON'
         col.operator("blendtagger.export_annotations", text="Export CSV").format = 'CSV'
 
         # Submit to repository
-        box = layout.box()
-        box.label(text="Repository")
+        box = draw_section(layout, "Repository")
         col = box.column(align=True)
         col.operator("blendtagger.submit_annotations", text="Submit to Repository")
 
-        # Settings
-        box = layout.box()
-        box.label(text="Settings")
-        col = box.column(align=True)
+class BLENDTAGGER_PT_tools_settings(Panel):
+    bl_label = "Settings"
+    bl_idname = "BLENDTAGGER_PT_tools_settings"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'BlendTagger'
+    bl_parent_id = "BLENDTAGGER_PT_tools_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        # Only drawn while expanded
+        col = self.layout.column(align=True)
         col.prop(context.scene, "blendtagger_api_key", text="API Key")
         col.prop(context.scene, "blendtagger_repository_url", text="Repository URL")
 
-def register():
-    bpy.utils.register_class(BLENDTAGGER_PT_main_panel)
-    bpy.utils.register_class(BLENDTAGGER_PT_tools_panel)
+_classes = (
+    BLENDTAGGER_PT_main_panel,
+    BLENDTAGGER_PT_tools_panel,
+    BLENDTAGGER_PT_tools_settings,
+)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
 
-    # Register properties
-    bpy.types.Scene.blendtagger_mode = bpy.props.EnumProperty(
-        items=[
-            ('OBJECT', "Object", "Object-level annotation mode"),
-            ('MESH', "Mesh", "Mesh component annotation mode"),
-            ('ANIMATION', "Animation", "Animation data annotation mode"),
-        ],
+# Scene properties, set in order on register and removed in reverse
+_PROPS = (
+    ("blendtagger_mode", EnumProperty(
+        items=_MODE_ITEMS,
         default='OBJECT',
         name="Mode"
-    )
-    bpy.types.Scene.blendtagger_api_key = bpy.props.StringProperty(
+    )),
+    ("blendtagger_api_key", StringProperty(
         name="API Key",
         description="API key for repository submission",
         subtype='PASSWORD'
-    )
-    bpy.types.Scene.blendtagger_repository_url = bpy.props.StringProperty(
+    )),
+    ("blendtagger_repository_url", StringProperty(
         name="Repository URL",
         description="URL for the annotation repository",
         default="https://api.blendtagger.com/submit"
-    )
+    )),
+)
+
+def register():
+    _register_classes()
+
+    # Register properties
+    for name, prop in _PROPS:
+        setattr(bpy.types.Scene, name, prop)
 
 def unregister():
-    del bpy.types.Scene.blendtagger_repository_url
-    del bpy.types.Scene.blendtagger_api_key
-    del bpy.types.Scene.blendtagger_mode
+    _STATS_LABELS.clear()
+    for name, _ in reversed(_PROPS):
+        delattr(bpy.types.Scene, name)
 
-    bpy.utils.unregister_class(BLENDTAGGER_PT_tools_panel)
-    bpy.utils.unregister_class(BLENDTAGGER_PT_main_panel)
+    _unregister_classes()